@@ -13,7 +13,7 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchJob:
     """A batch processing job compatible with the test-suite expectations.
 
@@ -331,10 +331,20 @@ class BatchProcessor:
 
         return False
 
-    def batch_iterator(self, emails: List[Dict[str, Any]]):
-        """Yield lists of emails according to configured `batch_size`."""
-        for i in range(0, len(emails), self.batch_size):
-            yield emails[i : i + self.batch_size]
+    def batch_bounds(self, total: int) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) index pairs covering `total` items per `batch_size`."""
+        size = self.batch_size
+        for start in range(0, total, size):
+            yield start, min(start + size, total)
+
+    def batch_iterator(self, emails: Sequence[Dict[str, Any]]):
+        """Yield slices of emails according to configured `batch_size`.
+
+        Callers that can work on indices should use `batch_bounds` and
+        skip the per-batch slice copy.
+        """
+        for start, end in self.batch_bounds(len(emails)):
+            yield emails[start:end]
 
     def process_realtime(
         self,
@@ -553,6 +563,17 @@ class BatchProcessor:
 
         return removed
 
+    def reset(self) -> None:
+        """
+        Drop all jobs and cancellation flags, keeping the instance reusable.
+
+        Only call this while no job is running. The active-job counter is
+        left alone, since a running job releases its slot when it finishes.
+        """
+        with self._lock:
+            self._jobs.clear()
+            self._cancel_flags.clear()
+
     def list_jobs(self) -> List[BatchJob]:
         """List all jobs (BatchJob objects)."""
         with self._lock:
@@ -31,8 +31,9 @@ class CircuitStats:
 
     failures: int = 0
     successes: int = 0
-    last_failure: float = 0.0
+    last_failure: float = 0.0  # Wall-clock timestamps, for reporting
     last_success: float = 0.0
+    failed_at: float = 0.0  # Breaker clock reading, for recovery timing
     state: CircuitState = CircuitState.CLOSED
     total_calls: int = 0
     total_failures: int = 0
@@ -65,6 +66,7 @@ class CircuitBreaker:
         failure_threshold: int = 3,
         recovery_timeout: float = 30.0,
         success_threshold: int = 1,
+        time_source: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize circuit breaker.
@@ -73,10 +75,13 @@ class CircuitBreaker:
             failure_threshold: Consecutive failures to open circuit
             recovery_timeout: Seconds before attempting recovery
             success_threshold: Successes needed to close circuit from half-open
+            time_source: Monotonic clock for recovery timing (tests inject
+                a fake clock); reported timestamps always use time.time()
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.success_threshold = success_threshold
+        self._now = time_source
 
         self._circuits: Dict[str, CircuitStats] = {}
         # Use reentrant lock to allow nested calls to get_state/get_stats without deadlock
@@ -94,7 +99,7 @@ class CircuitBreaker:
 
             if stats.state == CircuitState.OPEN:
                 # Check if recovery timeout has elapsed
-                elapsed = time.time() - stats.last_failure
+                elapsed = self._now() - stats.failed_at
                 if elapsed >= self.recovery_timeout:
                     stats.state = CircuitState.HALF_OPEN
                     stats.successes = 0  # Reset success counter for half-open test
@@ -144,12 +149,25 @@ class CircuitBreaker:
 
         May transition to OPEN if failure threshold reached.
         """
+        self.record_failures(provider, 1)
+
+    def record_failures(self, provider: str, count: int) -> None:
+        """
+        Record several failed calls under a single lock acquisition.
+
+        Equivalent to calling record_failure() count times; useful when
+        replaying failures from a log.
+        """
+        if count <= 0:
+            return
+
         with self._lock:
             stats = self._circuits.get(provider, CircuitStats())
-            stats.failures += 1
+            stats.failures += count
             stats.last_failure = time.time()
-            stats.total_calls += 1
-            stats.total_failures += 1
+            stats.failed_at = self._now()
+            stats.total_calls += count
+            stats.total_failures += count
             stats.successes = 0  # Reset consecutive success count
 
             if stats.state == CircuitState.HALF_OPEN:
@@ -187,7 +205,7 @@ class CircuitBreaker:
             }
 
             if state == CircuitState.OPEN:
-                remaining = self.recovery_timeout - (time.time() - stats.last_failure)
+                remaining = self.recovery_timeout - (self._now() - stats.failed_at)
                 result["recovery_in_seconds"] = max(0, remaining)
 
             return result
@@ -18,9 +18,9 @@ from typing import Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CalibrationEntry:
-    """A single calibration data point."""
+    """A single calibration data point (immutable once logged)."""
 
     predicted: str
     actual: Optional[str]
@@ -30,7 +30,7 @@ class CalibrationEntry:
 
     def __post_init__(self):
         if self.actual is not None:
-            self.correct = self.predicted == self.actual
+            object.__setattr__(self, "correct", self.predicted == self.actual)
 
 
 class ConfidenceCalibrator:
@@ -75,6 +75,7 @@ class ConfidenceCalibrator:
                 - calibration_file: Path to calibration data file
                 - auto_adjust: Enable automatic threshold adjustment
                 - min_samples: Minimum samples before auto-adjust (50)
+                - save_every: Predictions buffered between file writes (100)
         """
         config = config or {}
 
@@ -96,6 +97,10 @@ class ConfidenceCalibrator:
         self._predictions: Dict[str, List[CalibrationEntry]] = defaultdict(list)
         self._lock = threading.Lock()
 
+        # Write-behind: the file is rewritten once per save_every predictions
+        self.save_every = max(1, config.get("save_every", 100))
+        self._unsaved = 0
+
         # Load existing calibration data
         self._load_calibration()
 
@@ -169,14 +174,20 @@ class ConfidenceCalibrator:
             self._predictions[predicted_folder].append(entry)
 
             # Auto-save periodically
-            total = sum(len(v) for v in self._predictions.values())
-            if total % 100 == 0:
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
                 self._save_calibration()
 
             # Auto-adjust thresholds if enabled
             if self.auto_adjust and actual_folder is not None:
                 self._maybe_auto_adjust(predicted_folder)
 
+    def flush(self) -> None:
+        """Write buffered predictions to the calibration file, if any."""
+        with self._lock:
+            if self._unsaved:
+                self._save_calibration()
+
     def record_correction(
         self, predicted_folder: str, actual_folder: str, confidence: float
     ) -> None:
@@ -353,6 +364,7 @@ class ConfidenceCalibrator:
 
             with open(self.calibration_file, "w", encoding="utf-8") as f:
                 json.dump(data, f)
+            self._unsaved = 0
 
             logger.debug(f"Saved calibration data to {self.calibration_file}")
         except Exception as e:
@@ -379,6 +391,7 @@ class ConfidenceCalibrator:
         """Clear all calibration data."""
         with self._lock:
             self._predictions.clear()
+            self._unsaved = 0
 
         # Also remove file
         try:
@@ -16,13 +16,22 @@ import logging
 import os
 import threading
 import time
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import DefaultDict, Deque, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _training_response(folder: str) -> str:
+    """Expected model response for a folder (depends on the folder only)."""
+    return json.dumps({"folder": folder, "confidence": 0.95})
+
+
+@dataclass(slots=True)
 class FeedbackEntry:
     """A single user feedback entry."""
 
@@ -70,6 +79,10 @@ class FeedbackLoop:
         loop.export_training_data("training.jsonl")
     """
 
+    # Stored text limits; inputs are cut before the entry is built
+    MAX_SUBJECT_LENGTH = 500
+    MAX_BODY_LENGTH = 1500
+
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialize feedback loop.
@@ -79,27 +92,43 @@ class FeedbackLoop:
                 - enabled: Enable feedback collection (default: False)
                 - consent_given: User has given consent (default: False)
                 - min_samples: Minimum samples before export (default: 100)
-                - data_file: Path to feedback data file
+                - data_file: Path to feedback data file (JSONL)
                 - max_entries: Maximum entries to keep (default: 10000)
+                - save_every: Entries buffered between file writes (default: 50)
         """
         config = config or {}
 
         self._enabled = config.get("enabled", False)
         self._consent_given = config.get("consent_given", False)
         self.min_samples = config.get("min_samples", 100)
-        self.max_entries = config.get("max_entries", 10000)
+        # At least one slot, so eviction and the window counters stay in step
+        self.max_entries = max(1, config.get("max_entries", 10000))
 
         # Data storage path
         self.data_file = config.get(
             "data_file", os.path.expanduser("~/.mailsorter/feedback.json")
         )
+        # Compaction writes here first, then swaps it in with os.replace
+        self._tmp_file = self.data_file + ".tmp"
 
         # In-memory feedback storage
-        self._entries: List[FeedbackEntry] = []
+        # Bounded: appending past max_entries evicts the oldest entry
+        self._entries: Deque[FeedbackEntry] = deque(maxlen=self.max_entries)
         self._lock = threading.Lock()
+        # Serializes file writes; taken before _lock, never while holding it
+        self._io_lock = threading.Lock()
+
+        # Write-behind: new entries are appended once per save_every entries
+        self.save_every = max(1, config.get("save_every", 50))
+        self._unsaved = 0
+
+        # JSONL file bookkeeping (guarded by _io_lock), used to decide when to compact
+        self._file_lines = 0
+        self._needs_rewrite = False
 
-        # Statistics
-        self._stats = {"total_feedback": 0, "corrections": 0, "confirmations": 0}
+        # Corrections among the retained entries, kept in step with eviction
+        self._corrections = 0
+        self._patterns: DefaultDict[str, Counter] = defaultdict(Counter)
 
         # Load existing data
         self._load_data()
@@ -152,8 +181,8 @@ class FeedbackLoop:
 
         entry = FeedbackEntry(
             email_id=email_id,
-            subject=subject[:500],  # Truncate
-            body=body[:1500],  # Truncate
+            subject=subject[: self.MAX_SUBJECT_LENGTH],
+            body=body[: self.MAX_BODY_LENGTH],
             predicted_folder=predicted_folder,
             actual_folder=actual_folder,
             confidence=confidence,
@@ -161,21 +190,14 @@ class FeedbackLoop:
         )
 
         with self._lock:
-            self._entries.append(entry)
-            self._stats["total_feedback"] += 1
+            self._append_entry(entry)
 
-            if entry.is_correct:
-                self._stats["confirmations"] += 1
-            else:
-                self._stats["corrections"] += 1
-
-            # Prune old entries if needed
-            if len(self._entries) > self.max_entries:
-                self._entries = self._entries[-self.max_entries :]
+            # Auto-save periodically (counted, so pruning cannot pin it on)
+            self._unsaved += 1
+            save_due = self._unsaved >= self.save_every
 
-            # Auto-save periodically
-            if len(self._entries) % 50 == 0:
-                self._save_data()
+        if save_due:
+            self._save_data()
 
         logger.debug(
             f"Recorded feedback: {predicted_folder} → {actual_folder} "
@@ -184,11 +206,36 @@ class FeedbackLoop:
 
         return True
 
+    def _append_entry(self, entry: FeedbackEntry) -> None:
+        """Append an entry (caller holds the lock), updating window counters."""
+        entries = self._entries
+        if entries and len(entries) == entries.maxlen:
+            self._forget_entry(entries[0])
+        entries.append(entry)
+        if not entry.is_correct:
+            self._corrections += 1
+            self._patterns[entry.predicted_folder][entry.actual_folder] += 1
+
+    def _forget_entry(self, entry: FeedbackEntry) -> None:
+        """Undo an evicted entry's contribution to the window counters."""
+        if not entry.is_correct:
+            self._corrections -= 1
+            counts = self._patterns[entry.predicted_folder]
+            counts[entry.actual_folder] -= 1
+            if counts[entry.actual_folder] <= 0:
+                del counts[entry.actual_folder]
+                if not counts:
+                    del self._patterns[entry.predicted_folder]
+
+    def flush(self) -> None:
+        """Write buffered feedback to the data file, if any."""
+        self._save_data()
+
     def get_stats(self) -> Dict:
         """Get feedback statistics."""
         with self._lock:
             total = len(self._entries)
-            corrections = sum(1 for e in self._entries if not e.is_correct)
+            corrections = self._corrections
 
             accuracy = 0.0
             if total > 0:
@@ -227,7 +274,7 @@ class FeedbackLoop:
                 )
                 return None
 
-            entries = self._entries.copy()
+            entries = list(self._entries)
 
         # Filter entries
         if not include_correct:
@@ -248,10 +295,11 @@ class FeedbackLoop:
 
         # Write JSONL format for fine-tuning
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                for entry in entries:
-                    training_example = self._format_training_example(entry)
-                    f.write(json.dumps(training_example) + "\n")
+            with open(output_file, "w", encoding="utf-8", buffering=65536) as f:
+                f.writelines(
+                    json.dumps(self._format_training_example(entry)) + "\n"
+                    for entry in entries
+                )
 
             logger.info(f"Exported {len(entries)} training examples to {output_file}")
             return output_file
@@ -274,8 +322,8 @@ Email Body: {entry.body[:500]}
 
 Respond with JSON: {{"folder": "...", "confidence": 0.9}}"""
 
-        # Build the expected response
-        response = json.dumps({"folder": entry.actual_folder, "confidence": 0.95})
+        # Build the expected response (cached per folder)
+        response = _training_response(entry.actual_folder)
 
         return {"prompt": prompt, "response": response, "source": "user_feedback"}
 
@@ -285,59 +333,136 @@ Respond with JSON: {{"folder": "...", "confidence": 0.9}}"""
 
         Called when user requests data deletion (GDPR right to erasure).
         """
-        with self._lock:
-            self._entries.clear()
-            self._stats = {"total_feedback": 0, "corrections": 0, "confirmations": 0}
-
-        # Delete data file
-        try:
-            if os.path.exists(self.data_file):
-                os.remove(self.data_file)
-        except Exception as e:
-            logger.warning(f"Failed to delete feedback file: {e}")
+        with self._io_lock:
+            with self._lock:
+                self._entries.clear()
+                self._corrections = 0
+                self._patterns.clear()
+                self._unsaved = 0
+
+            self._file_lines = 0
+            self._needs_rewrite = False
+
+            # Delete data file, and any compaction temp file left by a crash
+            for path in (self.data_file, self._tmp_file):
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except Exception as e:
+                    logger.warning(f"Failed to delete feedback file: {e}")
 
         logger.info("Feedback data cleared")
 
     def _load_data(self) -> None:
-        """Load feedback data from file."""
+        """
+        Load feedback data from file.
+
+        The file is JSONL (one entry per line). The legacy single-object
+        format ({"entries": [...], "stats": {...}}) is still read and gets
+        rewritten as JSONL on the next save; its stats block is ignored, as
+        get_stats derives counts from the entries. Corrupted lines are skipped,
+        and a temp file left by an interrupted compaction is deleted.
+        """
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            if os.path.exists(self._tmp_file):
+                os.remove(self._tmp_file)
+
+            if not os.path.exists(self.data_file):
+                return
 
-                self._entries = [FeedbackEntry(**e) for e in data.get("entries", [])]
-                self._stats = data.get("stats", self._stats)
+            with open(self.data_file, "r", encoding="utf-8") as f:
+                text = f.read()
 
-                logger.debug(f"Loaded {len(self._entries)} feedback entries")
+            try:
+                legacy = json.loads(text)
+            except ValueError:
+                legacy = None
+
+            if isinstance(legacy, dict) and "entries" in legacy:
+                rows = legacy["entries"]
+                self._needs_rewrite = True
+            else:
+                rows = []
+                for line in text.splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        self._needs_rewrite = True
+                self._file_lines = len(rows)
+
+            for row in rows[-self.max_entries :]:
+                self._append_entry(FeedbackEntry(**row))
+
+            logger.debug(f"Loaded {len(self._entries)} feedback entries")
         except Exception as e:
             logger.warning(f"Failed to load feedback data: {e}")
 
+    @staticmethod
+    def _entry_line(e: FeedbackEntry) -> str:
+        """Serialize one entry as a JSONL line."""
+        return (
+            json.dumps(
+                {
+                    "email_id": e.email_id,
+                    "subject": e.subject,
+                    "body": e.body,
+                    "predicted_folder": e.predicted_folder,
+                    "actual_folder": e.actual_folder,
+                    "confidence": e.confidence,
+                    "timestamp": e.timestamp,
+                }
+            )
+            + "\n"
+        )
+
     def _save_data(self) -> None:
-        """Save feedback data to file."""
-        try:
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-
-            data = {
-                "entries": [
-                    {
-                        "email_id": e.email_id,
-                        "subject": e.subject,
-                        "body": e.body,
-                        "predicted_folder": e.predicted_folder,
-                        "actual_folder": e.actual_folder,
-                        "confidence": e.confidence,
-                        "timestamp": e.timestamp,
-                    }
-                    for e in self._entries
-                ],
-                "stats": self._stats,
-            }
+        """
+        Save unsaved feedback to file.
 
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f)
+        New entries are appended as JSONL lines; a torn last line is skipped
+        on load. The file is compacted (rewritten with only the kept entries,
+        via a temp file and os.replace) once pruned entries make up more than
+        half of it, or after loading a legacy/corrupted file.
 
-        except Exception as e:
-            logger.warning(f"Failed to save feedback data: {e}")
+        Only the snapshot is taken under the data lock; serialization and
+        disk writes happen under the I/O lock, so recorders are not held up
+        by file access.
+        """
+        with self._io_lock:
+            with self._lock:
+                kept = len(self._entries)
+                pending = min(self._unsaved, kept)
+                rewrite = self._needs_rewrite or self._file_lines + pending > 2 * kept
+                if rewrite:
+                    batch = list(self._entries)
+                else:
+                    batch = list(islice(self._entries, kept - pending, None))
+                self._unsaved = 0
+
+            if not rewrite and not batch:
+                return
+
+            try:
+                os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+                if rewrite:
+                    # Write aside and swap in, so a crash never leaves a torn file
+                    with open(self._tmp_file, "w", encoding="utf-8") as f:
+                        f.writelines(self._entry_line(e) for e in batch)
+                    os.replace(self._tmp_file, self.data_file)
+                else:
+                    with open(self.data_file, "a", encoding="utf-8") as f:
+                        f.writelines(self._entry_line(e) for e in batch)
+
+                self._file_lines = (
+                    len(batch) if rewrite else self._file_lines + len(batch)
+                )
+                self._needs_rewrite = False
+            except Exception as e:
+                # The file may be partial now; rewrite it in full next time
+                self._needs_rewrite = True
+                logger.warning(f"Failed to save feedback data: {e}")
 
     def get_correction_patterns(self) -> Dict[str, Dict[str, int]]:
         """
@@ -346,20 +471,10 @@ Respond with JSON: {{"folder": "...", "confidence": 0.9}}"""
         Returns a dict showing predicted → actual mappings.
         Useful for identifying systematic errors.
         """
-        patterns: Dict[str, Dict[str, int]] = {}
-
         with self._lock:
-            for entry in self._entries:
-                if not entry.is_correct:
-                    if entry.predicted_folder not in patterns:
-                        patterns[entry.predicted_folder] = {}
-
-                    actual = entry.actual_folder
-                    patterns[entry.predicted_folder][actual] = (
-                        patterns[entry.predicted_folder].get(actual, 0) + 1
-                    )
-
-        return patterns
+            return {
+                predicted: dict(counts) for predicted, counts in self._patterns.items()
+            }
 
 
 # Global feedback loop instance
@@ -379,7 +494,19 @@ def get_feedback_loop(config: Optional[Dict] = None) -> FeedbackLoop:
     """
     global _feedback_loop
 
+    # Fast path: once created, the instance is never replaced except by reset
+    loop = _feedback_loop
+    if loop is not None:
+        return loop
+
     with _loop_lock:
         if _feedback_loop is None:
             _feedback_loop = FeedbackLoop(config)
         return _feedback_loop
+
+
+def reset_feedback_loop() -> None:
+    """Reset the global feedback loop (for testing)."""
+    global _feedback_loop
+    with _loop_lock:
+        _feedback_loop = None
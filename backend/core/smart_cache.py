@@ -13,7 +13,7 @@ import re
 import threading
 import time
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..providers.base import ClassificationResult
 
@@ -372,26 +372,68 @@ class SmartCache:
         now = time.time()
 
         with self._lock:
-            # Store in sender cache (for consistent sender handling)
-            sender_key = self._normalize_sender(sender)
-            if sender_key:
-                self._sender_cache[sender_key] = CacheEntry(
-                    folder=folder, confidence=confidence, timestamp=now
-                )
+            self._store_unlocked(subject, body, sender, folder, confidence, now)
+            self._prune_if_needed()
 
-            # Store in hash cache
-            content_hash = self._hash_content(subject, body)
-            self._hash_cache[content_hash] = CacheEntry(
+    def store_many(self, items: Iterable[Tuple[str, str, str, str, float]]) -> int:
+        """
+        Store several classification results under a single lock.
+
+        Same rules as store(); pruning runs once after the whole batch.
+
+        Args:
+            items: (subject, body, sender, folder, confidence) tuples
+
+        Returns:
+            Number of results stored
+        """
+        if not self.enabled:
+            return 0
+
+        now = time.time()
+        stored = 0
+
+        with self._lock:
+            for subject, body, sender, folder, confidence in items:
+                if confidence < self.min_confidence:
+                    continue
+                self._store_unlocked(subject, body, sender, folder, confidence, now)
+                stored += 1
+            self._prune_if_needed()
+
+        return stored
+
+    def _store_unlocked(
+        self,
+        subject: str,
+        body: str,
+        sender: str,
+        folder: str,
+        confidence: float,
+        now: float,
+    ) -> None:
+        """Write one result to the sender and hash caches (caller holds lock)."""
+        # Store in sender cache (for consistent sender handling)
+        sender_key = self._normalize_sender(sender)
+        if sender_key:
+            self._sender_cache[sender_key] = CacheEntry(
                 folder=folder, confidence=confidence, timestamp=now
             )
 
-            self._stats["stores"] += 1
+        # Store in hash cache
+        content_hash = self._hash_content(subject, body)
+        self._hash_cache[content_hash] = CacheEntry(
+            folder=folder, confidence=confidence, timestamp=now
+        )
+
+        self._stats["stores"] += 1
 
-            # Prune old entries periodically
-            if len(self._hash_cache) > 10000:
-                self._prune_cache(self._hash_cache, self.hash_ttl)
-            if len(self._sender_cache) > 5000:
-                self._prune_cache(self._sender_cache, self.sender_ttl)
+    def _prune_if_needed(self) -> None:
+        """Prune old entries once a cache grows too large (caller holds lock)."""
+        if len(self._hash_cache) > 10000:
+            self._prune_cache(self._hash_cache, self.hash_ttl)
+        if len(self._sender_cache) > 5000:
+            self._prune_cache(self._sender_cache, self.sender_ttl)
 
     def invalidate_sender(self, sender: str) -> bool:
         """
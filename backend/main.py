@@ -16,29 +16,40 @@ from backend.core.orchestrator import Orchestrator  # noqa: E402
 # Pour toute hypothèse technique non vérifiée, voir les TODO dans le code.
 # Toute modification doit être validée par audit RGPD et revue technique.
 
+# Préfixe de longueur du protocole, compilé une seule fois.
+_LENGTH_PREFIX = struct.Struct("@I")
+
+# Sérialisation compacte : pas d'espaces inutiles dans les réponses.
+_JSON_SEPARATORS = (",", ":")
+
 
 def get_message():
     """
     Lit un message depuis stdin (Native Messaging Protocol).
     Format: 4 octets (longueur, little-endian) + JSON string.
     """
-    raw_length = sys.stdin.buffer.read(4)
+    raw_length = sys.stdin.buffer.read(_LENGTH_PREFIX.size)
     if len(raw_length) == 0:
         return None
-    message_length = struct.unpack("@I", raw_length)[0]
-    message = sys.stdin.buffer.read(message_length).decode("utf-8")
-    return json.loads(message)
+    message_length = _LENGTH_PREFIX.unpack(raw_length)[0]
+    return json.loads(sys.stdin.buffer.read(message_length))
 
 
 def send_message(message_content):
     """
     Envoie un message vers stdout (Native Messaging Protocol).
     Format: 4 octets (longueur, little-endian) + JSON string.
+
+    Appelé uniquement depuis la boucle principale : stdout n'a qu'un seul
+    écrivain, aucun verrou n'est donc nécessaire autour de l'écriture.
     """
-    encoded_content = json.dumps(message_content).encode("utf-8")
-    encoded_length = struct.pack("@I", len(encoded_content))
-    sys.stdout.buffer.write(encoded_length)
-    sys.stdout.buffer.write(encoded_content)
+    encoded_content = json.dumps(message_content, separators=_JSON_SEPARATORS).encode(
+        "utf-8"
+    )
+    encoded_length = _LENGTH_PREFIX.pack(len(encoded_content))
+    # Une seule écriture par trame ; le flush reste obligatoire car stdout
+    # est bufferisé et l'extension attend la réponse complète.
+    sys.stdout.buffer.write(encoded_length + encoded_content)
     sys.stdout.buffer.flush()
 
 
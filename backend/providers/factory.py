@@ -59,8 +59,10 @@ class ProviderFactory:
         """
         # Return cached instance if available
         cache_key = f"{name}:{hash(str(config))}" if config else name
-        if use_cache and cache_key in cls._instances:
-            return cls._instances[cache_key]
+        if use_cache:
+            cached = cls._instances.get(cache_key)
+            if cached is not None:
+                return cached
 
         # Check if provider is registered
         if name not in cls._providers:
@@ -1,6 +1,7 @@
 import logging
 import sys
 import os
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 
 # Ce code applique le Plan V5 du projet de tri d’emails LLM, avec conformité RGPD et sécurité renforcée.
@@ -12,7 +13,17 @@ def setup_logger(name="MailSorter"):
     """
     Configure un logger qui écrit dans un fichier et stderr.
     JAMAIS stdout car cela casserait le protocole Native Messaging.
+
+    Mémorisé par nom : un second appel renvoie le même logger sans
+    rouvrir le fichier ni empiler des handlers en double.
     """
+    # Nom passé en positionnel pour que le cache ne distingue pas
+    # setup_logger() de setup_logger("MailSorter")
+    return _setup_logger(name)
+
+
+@lru_cache(maxsize=None)
+def _setup_logger(name):
     # Chemin de log dans le dossier utilisateur ou temp pour éviter les problèmes de droits
     # TODO: Rendre ce chemin configurable via fichier de config
     log_dir = os.path.join(os.path.expanduser("~"), ".mailsorter", "logs")
@@ -1,10 +1,16 @@
 import atexit
 import faulthandler
+import json
 import os
 import sys
 import threading
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
 
 
 def _env_int(name: str, default: int) -> int:
@@ -68,3 +74,26 @@ def _start_periodic_dump(every_seconds: int) -> None:
 
     t = threading.Thread(target=_loop, daemon=True)
     t.start()
+
+
+# Read-only project files, parsed once per run and shared by every test module.
+@pytest.fixture(scope="session")
+def manifest() -> Dict[str, Any]:
+    return json.loads((REPO_ROOT / "extension" / "manifest.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def config_schema() -> Optional[Dict[str, Any]]:
+    schema_path = REPO_ROOT / "backend" / "json_schema" / "config_schema.json"
+    if not schema_path.exists():
+        return None
+    return json.loads(schema_path.read_bytes())
+
+
+# PrivacyGuard only compiles its patterns (or loads Presidio) in __init__;
+# sanitize() does not mutate it, so one instance serves the whole run.
+@pytest.fixture(scope="session")
+def privacy_guard():
+    from backend.core.privacy import PrivacyGuard
+
+    return PrivacyGuard()
@@ -132,7 +132,7 @@ class TestNativeMessaging:
         assert len(packed) == 4 + len(encoded)
 
         # Unpack should work
-        length = struct.unpack("<I", packed[:4])[0]
+        length = struct.unpack_from("<I", packed)[0]
         assert length == len(encoded)
 
     def test_stdin_stdout_availability(self):
@@ -12,7 +12,7 @@ Task: V5-024
 import json
 import pytest
 import struct
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
 from backend.core.orchestrator import Orchestrator
 from backend.providers.base import ClassificationResult
@@ -44,7 +44,7 @@ class TestNativeMessagingProtocol:
         full_message = encoded_length + encoded_content
 
         # Decode
-        length = struct.unpack("@I", full_message[:4])[0]
+        length = struct.unpack_from("@I", full_message)[0]
         decoded_content = full_message[4 : 4 + length].decode("utf-8")
         decoded = json.loads(decoded_content)
 
@@ -54,23 +54,27 @@ class TestNativeMessagingProtocol:
 @pytest.fixture
 def mock_orchestrator_deps():
     """Fixture that provides all orchestrator dependencies mocked."""
-    with patch("backend.core.orchestrator.ProviderFactory") as mock_factory, patch(
-        "backend.core.orchestrator.get_smart_cache"
-    ) as mock_get_cache, patch(
-        "backend.core.orchestrator.get_circuit_breaker"
-    ) as mock_get_breaker, patch(
-        "backend.core.orchestrator.get_rate_limiter"
-    ) as mock_get_limiter, patch(
-        "backend.core.orchestrator.get_prompt_engine"
-    ) as mock_get_prompt, patch(
-        "backend.core.orchestrator.get_calibrator"
-    ) as mock_get_calibrator, patch(
-        "backend.core.orchestrator.get_batch_processor"
-    ) as mock_get_batch, patch(
-        "backend.core.orchestrator.get_feedback_loop"
-    ) as mock_get_feedback, patch(
-        "backend.core.orchestrator.check_rate_limit"
-    ) as mock_check_rate:
+    with patch.multiple(
+        "backend.core.orchestrator",
+        ProviderFactory=DEFAULT,
+        get_smart_cache=DEFAULT,
+        get_circuit_breaker=DEFAULT,
+        get_rate_limiter=DEFAULT,
+        get_prompt_engine=DEFAULT,
+        get_calibrator=DEFAULT,
+        get_batch_processor=DEFAULT,
+        get_feedback_loop=DEFAULT,
+        check_rate_limit=DEFAULT,
+    ) as patched:
+        mock_factory = patched["ProviderFactory"]
+        mock_get_cache = patched["get_smart_cache"]
+        mock_get_breaker = patched["get_circuit_breaker"]
+        mock_get_limiter = patched["get_rate_limiter"]
+        mock_get_prompt = patched["get_prompt_engine"]
+        mock_get_calibrator = patched["get_calibrator"]
+        mock_get_batch = patched["get_batch_processor"]
+        mock_get_feedback = patched["get_feedback_loop"]
+        mock_check_rate = patched["check_rate_limit"]
 
         # Setup provider
         mock_provider = Mock()
@@ -3,111 +3,244 @@ Integration tests for the orchestrator with Phase 4 components.
 """
 
 import pytest
-from unittest.mock import Mock, patch
-
+from collections import ChainMap
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+from unittest.mock import DEFAULT, Mock, create_autospec, patch
+
+from backend.core.batch_processor import ProcessingMode
+from backend.core.circuit_breaker import CircuitBreaker
 from backend.core.orchestrator import Orchestrator
-from backend.providers.base import ClassificationResult
-
+from backend.core.rate_limiter import RateLimiter
+from backend.core.smart_cache import SmartCache
+from backend.providers.base import ClassificationResult, LLMProvider
+
+
+# Shared provider results; the orchestrator only reads their attributes.
+_INBOX_RESULT = ClassificationResult(
+    folder="Inbox",
+    confidence=0.85,
+    reasoning="Test classification",
+    tokens_used=100,
+    latency_ms=50,
+    source="ollama",
+)
+_INVOICE_RESULT = ClassificationResult(
+    folder="Invoices",
+    confidence=0.92,
+    reasoning="Contains invoice",
+    tokens_used=80,
+    latency_ms=100,
+    source="ollama",
+)
+_LOW_CONF_RESULT = ClassificationResult(
+    folder="Invoices",
+    confidence=0.3,  # Low confidence
+    reasoning="Uncertain",
+    tokens_used=50,
+    latency_ms=100,
+    source="ollama",
+)
+
+# Read-only configs, built once; tests pick one by name via the config fixture.
+BASE_CONFIG = MappingProxyType(
+    {
+        "provider": "ollama",
+        "folders": ["Inbox", "Invoices", "Newsletters", "Spam"],
+        "privacy": {"redact_emails": True},
+        "intelligence": {
+            "smart_cache": {"enabled": False},
+            "circuit_breaker": {"enabled": True},
+        },
+    }
+)
+
+_CONFIGS = {
+    "base": BASE_CONFIG,
+    "batch": MappingProxyType(
+        {
+            "provider": "ollama",
+            "folders": ["Inbox", "Spam"],
+            "intelligence": {"smart_cache": {"enabled": False}},
+        }
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One way for the pipeline to block or degrade, and its outcome."""
+
+    name: str
+    breaker_ok: bool = True
+    limiter_ok: bool = True
+    cal_ok: bool = True
+    primary_fails: bool = False
+    result: Optional[ClassificationResult] = None  # None keeps the default
+    config: Dict[str, Any] = field(default_factory=dict)
+    expected_match: Optional[str] = None
+    expected_folder: Optional[str] = None
+
+
+# Scenarios where classify raises
+BLOCK_SCENARIOS = [
+    Scenario("circuit_open", breaker_ok=False, expected_match="(?i)circuit"),
+    Scenario("rate_limited", limiter_ok=False, expected_match="(?i)rate"),
+]
+
+# Scenarios where classify still answers, with a fallback folder
+DEGRADE_SCENARIOS = [
+    Scenario(
+        "low_confidence",
+        cal_ok=False,
+        result=_LOW_CONF_RESULT,
+        config={"default_folder": "Inbox"},
+        expected_folder="Inbox",
+    ),
+    Scenario(
+        "provider_fallback",
+        primary_fails=True,
+        config={"provider": "openai", "fallback_provider": "ollama"},
+        expected_folder="Inbox",
+    ),
+]
+
+
+def _make_provider_mock(name="ollama", is_local=True):
+    """Provider mock restricted to the LLMProvider interface."""
+    provider = create_autospec(LLMProvider, instance=True, spec_set=True)
+    provider.get_name.return_value = name
+    provider.is_local = is_local
+    return provider
+
+
+def _apply_scenario(mocks, scenario):
+    """Override the default mocks with a scenario's failures."""
+    breaker = mocks["get_circuit_breaker"].return_value
+    breaker.can_execute.return_value = scenario.breaker_ok
+    limiter = mocks["RateLimiter"].return_value
+    limiter.acquire.return_value = scenario.limiter_ok
+    calibrator = mocks["get_calibrator"].return_value
+    calibrator.passes_threshold.return_value = scenario.cal_ok
+    if scenario.result is not None:
+        mocks["provider"].classify_email.return_value = scenario.result
+
+    if scenario.primary_fails:
+        # Primary fails, secondary (the default provider) succeeds
+        mock_primary = _make_provider_mock("openai", is_local=False)
+        mock_primary.classify_email.side_effect = Exception("API Error")
+        mocks["ProviderFactory"].create.side_effect = [
+            mock_primary,
+            mocks["provider"],
+        ]
 
-class TestOrchestratorIntegration:
-    """Integration tests for Orchestrator."""
 
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    def setup_method(self, method, mock_rate_limiter, mock_circuit, mock_factory):
-        """Setup orchestrator with mocked dependencies."""
-        # Mock provider
-        self.mock_provider = Mock()
-        self.mock_provider.get_name.return_value = "ollama"
-        self.mock_provider.is_local = True
-        self.mock_provider.classify.return_value = ClassificationResult(
-            folder="Inbox",
-            confidence=0.85,
-            reasoning="Test classification",
-            tokens_used=100,
-            latency_ms=50,
-            source="ollama",
+def _wire_defaults(mocks):
+    """Reset the dependency mocks and wire passing defaults.
+
+    Defaults: provider classifies to Inbox, cache misses, circuit closed,
+    rate limit passes, prompt builds, confidence passes. Instance mocks are
+    reset in place so orchestrators built earlier keep seeing them; every
+    attribute a test may override gets its return value and side effect
+    reassigned explicitly.
+    """
+    provider = mocks["provider"]
+    provider.reset_mock()
+    provider.get_name.return_value = "ollama"
+    provider.is_local = True
+    provider.classify_email.side_effect = None
+    provider.classify_email.return_value = _INBOX_RESULT
+    mocks["ProviderFactory"].reset_mock()
+    mocks["ProviderFactory"].create.side_effect = None
+    mocks["ProviderFactory"].create.return_value = provider
+
+    cache = mocks["SmartCache"].return_value
+    cache.reset_mock()
+    cache.lookup.return_value = None
+
+    breaker = mocks["get_circuit_breaker"].return_value
+    breaker.reset_mock()
+    breaker.can_execute.return_value = True
+
+    limiter = mocks["RateLimiter"].return_value
+    limiter.reset_mock()
+    limiter.acquire.return_value = True
+
+    prompt_engine = mocks["PromptEngine"].return_value
+    prompt_engine.reset_mock()
+    prompt_engine.build_prompt.return_value = {
+        "system": "System prompt",
+        "user": "User prompt",
+        "language": "en",
+    }
+
+    calibrator = mocks["get_calibrator"].return_value
+    calibrator.reset_mock()
+    calibrator.passes_threshold.return_value = True
+
+
+@pytest.fixture(scope="module")
+def orch_mocks_module():
+    """Patch the orchestrator's dependencies once for the whole module."""
+    with patch.multiple(
+        "backend.core.orchestrator",
+        ProviderFactory=DEFAULT,
+        SmartCache=DEFAULT,
+        get_circuit_breaker=DEFAULT,
+        RateLimiter=DEFAULT,
+        PromptEngine=DEFAULT,
+        get_calibrator=DEFAULT,
+    ) as mocks:
+        mocks["provider"] = _make_provider_mock()
+        mocks["ProviderFactory"].create.return_value = mocks["provider"]
+        mocks["SmartCache"].return_value = create_autospec(
+            SmartCache, instance=True, spec_set=True
         )
+        mocks["get_circuit_breaker"].return_value = create_autospec(
+            CircuitBreaker, instance=True, spec_set=True
+        )
+        mocks["RateLimiter"].return_value = create_autospec(
+            RateLimiter, instance=True, spec_set=True
+        )
+        yield mocks
 
-        mock_factory.create.return_value = self.mock_provider
 
-        # Mock circuit breaker
-        self.mock_breaker = Mock()
-        self.mock_breaker.is_available.return_value = True
-        mock_circuit.return_value = self.mock_breaker
+@pytest.fixture
+def orch_mocks(orch_mocks_module):
+    """Module patches with defaults re-wired around each test.
 
-        # Mock rate limiter
-        self.mock_limiter = Mock()
-        self.mock_limiter.acquire.return_value = True
-        mock_rate_limiter.return_value = self.mock_limiter
+    Tests override only the mock they care about. Defaults are restored on
+    teardown too, because the module-scoped orchestrator fixture is set up
+    before this one and must never see a previous test's overrides.
+    """
+    _wire_defaults(orch_mocks_module)
+    yield orch_mocks_module
+    _wire_defaults(orch_mocks_module)
 
-        self.config = {
-            "provider": "ollama",
-            "folders": ["Inbox", "Invoices", "Newsletters", "Spam"],
-            "privacy": {"redact_emails": True},
-            "intelligence": {
-                "smart_cache": {"enabled": False},
-                "circuit_breaker": {"enabled": True},
-            },
-        }
 
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.SmartCache")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    @patch("backend.core.orchestrator.PromptEngine")
-    @patch("backend.core.orchestrator.get_calibrator")
-    def test_classify_basic_flow(
-        self,
-        mock_calibrator,
-        mock_prompt,
-        mock_limiter,
-        mock_breaker_fn,
-        mock_cache,
-        mock_factory,
-    ):
-        """Should classify email through full pipeline."""
-        # Setup mocks
-        mock_provider = Mock()
-        mock_provider.get_name.return_value = "ollama"
-        mock_provider.is_local = True
-        mock_provider.classify.return_value = ClassificationResult(
-            folder="Invoices",
-            confidence=0.92,
-            reasoning="Contains invoice",
-            tokens_used=80,
-            latency_ms=100,
-            source="ollama",
-        )
-        mock_factory.create.return_value = mock_provider
+@pytest.fixture
+def config(request):
+    """Named config from _CONFIGS, selected with indirect parametrization."""
+    return _CONFIGS[request.param]
 
-        mock_cache_instance = Mock()
-        mock_cache_instance.lookup.return_value = None
-        mock_cache.return_value = mock_cache_instance
 
-        mock_breaker = Mock()
-        mock_breaker.is_available.return_value = True
-        mock_breaker_fn.return_value = mock_breaker
+@pytest.fixture(scope="module")
+def orchestrator(orch_mocks_module):
+    """Orchestrator built once on BASE_CONFIG for tests that do not mutate it.
 
-        mock_limiter_instance = Mock()
-        mock_limiter_instance.acquire.return_value = True
-        mock_limiter.return_value = mock_limiter_instance
+    Construction only needs the factory to hand back the shared provider;
+    it never re-wires defaults, so it cannot undo a test's mock overrides.
+    """
+    return Orchestrator(BASE_CONFIG)
 
-        mock_prompt_instance = Mock()
-        mock_prompt_instance.build_prompt.return_value = {
-            "system": "System prompt",
-            "user": "User prompt",
-            "language": "en",
-        }
-        mock_prompt.return_value = mock_prompt_instance
 
-        mock_cal = Mock()
-        mock_cal.passes_threshold.return_value = True
-        mock_calibrator.return_value = mock_cal
+class TestOrchestratorIntegration:
+    """Integration tests for Orchestrator."""
 
-        # Create orchestrator
-        orchestrator = Orchestrator(self.config)
+    def test_classify_basic_flow(self, orch_mocks, orchestrator):
+        """Should classify email through full pipeline."""
+        orch_mocks["provider"].classify_email.return_value = _INVOICE_RESULT
 
         # Classify
         result = orchestrator.classify(
@@ -121,28 +254,14 @@ class TestOrchestratorIntegration:
         assert result["confidence"] == 0.92
         assert "signature" in result
 
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.SmartCache")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    def test_cache_hit_skips_llm(
-        self, mock_limiter, mock_breaker_fn, mock_cache, mock_factory
-    ):
+    def test_cache_hit_skips_llm(self, orch_mocks, orchestrator):
         """Should skip LLM call on cache hit."""
         # Setup cache hit
-        mock_cache_instance = Mock()
-        mock_cache_instance.lookup.return_value = {
+        orch_mocks["SmartCache"].return_value.lookup.return_value = {
             "folder": "Cached",
             "confidence": 0.95,
             "source": "sender_cache",
         }
-        mock_cache.return_value = mock_cache_instance
-
-        mock_provider = Mock()
-        mock_factory.create.return_value = mock_provider
-
-        # Create orchestrator
-        orchestrator = Orchestrator(self.config)
 
         # Classify
         result = orchestrator.classify(
@@ -150,300 +269,49 @@ class TestOrchestratorIntegration:
         )
 
         # Provider should NOT be called
-        mock_provider.classify.assert_not_called()
+        orch_mocks["provider"].classify_email.assert_not_called()
 
         # Should return cached result
         assert result["folder"] == "Cached"
         assert result["source"] == "sender_cache"
 
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.SmartCache")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    def test_circuit_breaker_blocks(
-        self, mock_limiter, mock_breaker_fn, mock_cache, mock_factory
-    ):
-        """Should block when circuit is open."""
-        mock_cache_instance = Mock()
-        mock_cache_instance.lookup.return_value = None
-        mock_cache.return_value = mock_cache_instance
-
-        mock_breaker = Mock()
-        mock_breaker.is_available.return_value = False  # Circuit OPEN
-        mock_breaker_fn.return_value = mock_breaker
-
-        mock_factory.create.return_value = Mock()
-
-        orchestrator = Orchestrator(self.config)
-
-        # Should raise or return error
-        with pytest.raises(Exception) as exc_info:
-            orchestrator.classify(sender="test@test.com", subject="Test", body="Test")
-
-        assert (
-            "circuit" in str(exc_info.value).lower()
-            or "unavailable" in str(exc_info.value).lower()
-        )
-
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.SmartCache")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    def test_rate_limit_blocks(
-        self, mock_limiter, mock_breaker_fn, mock_cache, mock_factory
-    ):
-        """Should block when rate limited."""
-        mock_cache_instance = Mock()
-        mock_cache_instance.lookup.return_value = None
-        mock_cache.return_value = mock_cache_instance
-
-        mock_breaker = Mock()
-        mock_breaker.is_available.return_value = True
-        mock_breaker_fn.return_value = mock_breaker
-
-        mock_limiter_instance = Mock()
-        mock_limiter_instance.acquire.return_value = False  # Rate limited
-        mock_limiter.return_value = mock_limiter_instance
-
-        mock_factory.create.return_value = Mock()
+    @pytest.mark.parametrize("scenario", BLOCK_SCENARIOS, ids=lambda s: s.name)
+    def test_blocked_raises(self, orch_mocks, orchestrator, scenario):
+        """An open circuit or exhausted rate limit should stop classification."""
+        _apply_scenario(orch_mocks, scenario)
 
-        orchestrator = Orchestrator(self.config)
-
-        # Should raise or return error
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match=scenario.expected_match):
             orchestrator.classify(sender="test@test.com", subject="Test", body="Test")
 
-        assert "rate" in str(exc_info.value).lower()
-
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.SmartCache")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    @patch("backend.core.orchestrator.PromptEngine")
-    @patch("backend.core.orchestrator.get_calibrator")
-    def test_low_confidence_returns_inbox(
-        self,
-        mock_calibrator,
-        mock_prompt,
-        mock_limiter,
-        mock_breaker_fn,
-        mock_cache,
-        mock_factory,
-    ):
-        """Should return Inbox when confidence below threshold."""
-        mock_provider = Mock()
-        mock_provider.get_name.return_value = "ollama"
-        mock_provider.is_local = True
-        mock_provider.classify.return_value = ClassificationResult(
-            folder="Invoices",
-            confidence=0.3,  # Low confidence
-            reasoning="Uncertain",
-            tokens_used=50,
-            latency_ms=100,
-            source="ollama",
-        )
-        mock_factory.create.return_value = mock_provider
-
-        mock_cache_instance = Mock()
-        mock_cache_instance.lookup.return_value = None
-        mock_cache.return_value = mock_cache_instance
-
-        mock_breaker = Mock()
-        mock_breaker.is_available.return_value = True
-        mock_breaker_fn.return_value = mock_breaker
+    @pytest.mark.parametrize("scenario", DEGRADE_SCENARIOS, ids=lambda s: s.name)
+    def test_degrades_to_folder(self, orch_mocks, scenario):
+        """Low confidence and provider failover should still return a folder."""
+        _apply_scenario(orch_mocks, scenario)
+        # Orchestrator only reads config by key, so layer the overrides
+        # instead of copying BASE_CONFIG.
+        orchestrator = Orchestrator(ChainMap(scenario.config, BASE_CONFIG))
 
-        mock_limiter_instance = Mock()
-        mock_limiter_instance.acquire.return_value = True
-        mock_limiter.return_value = mock_limiter_instance
-
-        mock_prompt_instance = Mock()
-        mock_prompt_instance.build_prompt.return_value = {
-            "system": "System",
-            "user": "User",
-            "language": "en",
-        }
-        mock_prompt.return_value = mock_prompt_instance
-
-        mock_cal = Mock()
-        mock_cal.passes_threshold.return_value = False  # Below threshold
-        mock_calibrator.return_value = mock_cal
-
-        config = dict(self.config)
-        config["default_folder"] = "Inbox"
-
-        orchestrator = Orchestrator(config)
         result = orchestrator.classify(
             sender="test@test.com", subject="Test", body="Test"
         )
 
-        # Should fallback to default
-        assert result["folder"] == "Inbox"
-        assert result["confidence_passed"] is False
-
-
-class TestOrchestratorProviderFallback:
-    """Tests for provider fallback behavior."""
-
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.SmartCache")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    @patch("backend.core.orchestrator.PromptEngine")
-    @patch("backend.core.orchestrator.get_calibrator")
-    def test_fallback_on_primary_failure(
-        self,
-        mock_calibrator,
-        mock_prompt,
-        mock_limiter,
-        mock_breaker_fn,
-        mock_cache,
-        mock_factory,
-    ):
-        """Should fallback to secondary provider on failure."""
-        # Primary fails, secondary succeeds
-        mock_primary = Mock()
-        mock_primary.get_name.return_value = "openai"
-        mock_primary.is_local = False
-        mock_primary.classify.side_effect = Exception("API Error")
-
-        mock_secondary = Mock()
-        mock_secondary.get_name.return_value = "ollama"
-        mock_secondary.is_local = True
-        mock_secondary.classify.return_value = ClassificationResult(
-            folder="Inbox",
-            confidence=0.8,
-            reasoning="Fallback",
-            tokens_used=50,
-            latency_ms=100,
-            source="ollama",
-        )
-
-        # Factory returns different providers
-        call_count = [0]
-
-        def create_side_effect(name):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_primary
-            return mock_secondary
-
-        mock_factory.create.side_effect = create_side_effect
-        mock_factory.get_local_providers.return_value = ["ollama"]
-
-        # Setup other mocks
-        mock_cache_instance = Mock()
-        mock_cache_instance.lookup.return_value = None
-        mock_cache.return_value = mock_cache_instance
-
-        mock_breaker = Mock()
-        mock_breaker.is_available.return_value = True
-        mock_breaker.record_failure = Mock()
-        mock_breaker_fn.return_value = mock_breaker
-
-        mock_limiter_instance = Mock()
-        mock_limiter_instance.acquire.return_value = True
-        mock_limiter.return_value = mock_limiter_instance
-
-        mock_prompt_instance = Mock()
-        mock_prompt_instance.build_prompt.return_value = {
-            "system": "System",
-            "user": "User",
-            "language": "en",
-        }
-        mock_prompt.return_value = mock_prompt_instance
-
-        mock_cal = Mock()
-        mock_cal.passes_threshold.return_value = True
-        mock_calibrator.return_value = mock_cal
-
-        config = {
-            "provider": "openai",
-            "fallback_provider": "ollama",
-            "folders": ["Inbox", "Spam"],
-            "intelligence": {"smart_cache": {"enabled": False}},
-        }
-
-        orchestrator = Orchestrator(config)
-
-        # Should succeed via fallback
-        result = orchestrator.classify(
-            sender="test@test.com", subject="Test", body="Test"
-        )
-
-        assert result["folder"] == "Inbox"
+        assert result["folder"] == scenario.expected_folder
         assert result["source"] == "ollama"
+        assert result["confidence_passed"] is scenario.cal_ok
 
 
 class TestOrchestratorBatchMode:
     """Tests for batch processing mode."""
 
-    @patch("backend.core.orchestrator.ProviderFactory")
-    @patch("backend.core.orchestrator.SmartCache")
-    @patch("backend.core.orchestrator.get_circuit_breaker")
-    @patch("backend.core.orchestrator.RateLimiter")
-    @patch("backend.core.orchestrator.PromptEngine")
-    @patch("backend.core.orchestrator.get_calibrator")
+    @pytest.mark.parametrize("config", ["batch"], indirect=True)
     @patch("backend.core.orchestrator.get_processor")
-    def test_batch_classify(
-        self,
-        mock_processor_fn,
-        mock_calibrator,
-        mock_prompt,
-        mock_limiter,
-        mock_breaker_fn,
-        mock_cache,
-        mock_factory,
-    ):
+    def test_batch_classify(self, mock_processor_fn, orch_mocks, config):
         """Should process emails in batch."""
-        # Setup mocks
-        mock_provider = Mock()
-        mock_provider.get_name.return_value = "ollama"
-        mock_provider.is_local = True
-        mock_provider.classify.return_value = ClassificationResult(
-            folder="Inbox",
-            confidence=0.9,
-            reasoning="Batch",
-            tokens_used=50,
-            latency_ms=50,
-            source="ollama",
-        )
-        mock_factory.create.return_value = mock_provider
-
-        mock_cache_instance = Mock()
-        mock_cache_instance.lookup.return_value = None
-        mock_cache.return_value = mock_cache_instance
-
-        mock_breaker = Mock()
-        mock_breaker.is_available.return_value = True
-        mock_breaker_fn.return_value = mock_breaker
-
-        mock_limiter_instance = Mock()
-        mock_limiter_instance.acquire.return_value = True
-        mock_limiter.return_value = mock_limiter_instance
-
-        mock_prompt_instance = Mock()
-        mock_prompt_instance.build_prompt.return_value = {
-            "system": "System",
-            "user": "User",
-            "language": "en",
-        }
-        mock_prompt.return_value = mock_prompt_instance
-
-        mock_cal = Mock()
-        mock_cal.passes_threshold.return_value = True
-        mock_calibrator.return_value = mock_cal
-
         # Setup batch processor mock
         mock_processor = Mock()
-        mock_processor.detect_mode.return_value = "batch"
+        mock_processor.detect_mode.return_value = ProcessingMode.BATCH
         mock_processor_fn.return_value = mock_processor
 
-        config = {
-            "provider": "ollama",
-            "folders": ["Inbox", "Spam"],
-            "intelligence": {"smart_cache": {"enabled": False}},
-        }
-
         orchestrator = Orchestrator(config)
 
         emails = [
@@ -454,5 +322,10 @@ class TestOrchestratorBatchMode:
         results = orchestrator.classify_batch(emails)
 
         assert len(results) == 5
-        for result in results:
-            assert "folder" in result
+        required = {"folder"}
+        assert all(required <= result.keys() for result in results)
+
+        # Mode is decided once for the whole batch; providers have no batch
+        # call, so each email still goes through classify_email.
+        mock_processor.detect_mode.assert_called_once_with(email_count=5)
+        assert orch_mocks["provider"].classify_email.call_count == 5
@@ -9,104 +9,100 @@ Task: QA-001
 
 import pytest
 import importlib
-import os
+import importlib.util
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+
+pytestmark = pytest.mark.smoke
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_BACKEND = _REPO_ROOT / "backend"
+_EXTENSION = _REPO_ROOT / "extension"
+
+# find_spec locates the package without executing it.
+_PRESIDIO_AVAILABLE = importlib.util.find_spec("presidio_analyzer") is not None
+
+ALL_MODULES = [
+    # Core
+    "backend.core.orchestrator",
+    "backend.core.privacy",
+    "backend.core.rate_limiter",
+    "backend.core.circuit_breaker",
+    "backend.core.smart_cache",
+    "backend.core.confidence",
+    "backend.core.prompt_engine",
+    "backend.core.batch_processor",
+    "backend.core.feedback_loop",
+    "backend.core.attachment_heuristic",
+    # Providers
+    "backend.providers.base",
+    "backend.providers.factory",
+    "backend.providers.ollama_provider",
+    "backend.providers.openai_provider",
+    "backend.providers.anthropic_provider",
+    "backend.providers.gemini_provider",
+    # Utils
+    "backend.utils.logger",
+    "backend.utils.config",
+    "backend.utils.sanitize",
+    "backend.utils.security",
+]
+
+
+_ORCHESTRATOR_DEPS = (
+    "ProviderFactory",
+    "get_smart_cache",
+    "get_circuit_breaker",
+    "get_rate_limiter",
+    "get_prompt_engine",
+    "get_calibrator",
+    "get_batch_processor",
+    "get_feedback_loop",
+)
+
+
+@pytest.fixture(scope="module")
+def patched_orchestrator_deps():
+    """Patch the orchestrator's dependencies once for the module."""
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(patch(f"backend.core.orchestrator.{name}"))
+            for name in _ORCHESTRATOR_DEPS
+        }
+        mocks["ProviderFactory"].create.return_value = Mock()
+        yield mocks
+
+
+@pytest.fixture(scope="module")
+def smoke_orchestrator(patched_orchestrator_deps):
+    """Orchestrator with minimal config, shared by the smoke checks."""
+    from backend.core.orchestrator import Orchestrator
+
+    return Orchestrator({"provider": "ollama", "folders": ["Inbox"]})
 
 
 class TestModuleImports:
     """Verify all critical modules can be imported."""
 
-    def test_core_modules_importable(self):
-        """Core modules should be importable without errors."""
-        core_modules = [
-            "backend.core.orchestrator",
-            "backend.core.privacy",
-            "backend.core.rate_limiter",
-            "backend.core.circuit_breaker",
-            "backend.core.smart_cache",
-            "backend.core.confidence",
-            "backend.core.prompt_engine",
-            "backend.core.batch_processor",
-            "backend.core.feedback_loop",
-            "backend.core.attachment_heuristic",
-        ]
-
-        for module_name in core_modules:
-            try:
-                module = importlib.import_module(module_name)
-                assert module is not None, f"Module {module_name} imported as None"
-            except ImportError as e:
-                pytest.fail(f"Failed to import {module_name}: {e}")
-
-    def test_provider_modules_importable(self):
-        """Provider modules should be importable."""
-        provider_modules = [
-            "backend.providers.base",
-            "backend.providers.factory",
-            "backend.providers.ollama_provider",
-            "backend.providers.openai_provider",
-            "backend.providers.anthropic_provider",
-            "backend.providers.gemini_provider",
-        ]
-
-        for module_name in provider_modules:
-            try:
-                module = importlib.import_module(module_name)
-                assert module is not None
-            except ImportError as e:
-                pytest.fail(f"Failed to import {module_name}: {e}")
-
-    def test_utils_modules_importable(self):
-        """Utility modules should be importable."""
-        util_modules = [
-            "backend.utils.logger",
-            "backend.utils.config",
-            "backend.utils.sanitize",
-            "backend.utils.security",
-        ]
-
-        for module_name in util_modules:
-            try:
-                module = importlib.import_module(module_name)
-                assert module is not None
-            except ImportError as e:
-                pytest.fail(f"Failed to import {module_name}: {e}")
+    @pytest.mark.parametrize("module_name", ALL_MODULES)
+    def test_importable(self, module_name):
+        """Each critical module should be importable without errors."""
+        try:
+            module = importlib.import_module(module_name)
+            assert module is not None, f"Module {module_name} imported as None"
+        except ImportError as e:
+            pytest.fail(f"Failed to import {module_name}: {e}")
 
 
 class TestCoreClassesInstantiation:
     """Verify core classes can be instantiated."""
 
-    def test_orchestrator_instantiates(self):
+    def test_orchestrator_instantiates(self, smoke_orchestrator):
         """Orchestrator should instantiate with minimal config."""
-        from unittest.mock import patch, Mock
-
-        with patch("backend.core.orchestrator.ProviderFactory") as mock_factory, patch(
-            "backend.core.orchestrator.get_smart_cache"
-        ) as _mock_cache, patch(
-            "backend.core.orchestrator.get_circuit_breaker"
-        ) as _mock_breaker, patch(
-            "backend.core.orchestrator.get_rate_limiter"
-        ) as _mock_limiter, patch(
-            "backend.core.orchestrator.get_prompt_engine"
-        ) as _mock_prompt, patch(
-            "backend.core.orchestrator.get_calibrator"
-        ) as _mock_cal, patch(
-            "backend.core.orchestrator.get_batch_processor"
-        ) as _mock_batch, patch(
-            "backend.core.orchestrator.get_feedback_loop"
-        ) as _mock_feedback:
-
-            mock_provider = Mock()
-            mock_factory.create.return_value = mock_provider
-
-            from backend.core.orchestrator import Orchestrator
-
-            config = {
-                "provider": "ollama",
-                "folders": ["Inbox"],
-            }
-
-            orchestrator = Orchestrator(config)
-            assert orchestrator is not None
+        assert smoke_orchestrator is not None
 
     def test_privacy_guard_instantiates(self):
         """PrivacyGuard should instantiate."""
@@ -133,32 +129,17 @@ class TestCoreClassesInstantiation:
 class TestConfigurationLoading:
     """Verify configuration can be loaded."""
 
-    def test_config_schema_exists(self):
+    def test_config_schema_exists(self, config_schema):
         """Config schema should exist."""
-        schema_path = os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "backend",
-            "json_schema",
-            "config_schema.json",
-        )
-
         # Schema file may or may not exist, but if it does, it should be valid JSON
-        if os.path.exists(schema_path):
-            import json
-
-            with open(schema_path, "r") as f:
-                schema = json.load(f)
-            assert "type" in schema or "$schema" in schema
+        if config_schema is not None:
+            assert "type" in config_schema or "$schema" in config_schema
 
     def test_config_example_exists(self):
         """Config example should exist."""
-        example_path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "backend", "config.json.example"
-        )
+        example_path = _BACKEND / "config.json.example"
 
-        assert os.path.exists(example_path), "config.json.example not found"
+        assert example_path.exists(), "config.json.example not found"
 
 
 class TestBasicFunctionality:
@@ -202,6 +183,8 @@ class TestDependencyAvailability:
         ]
 
         for package in required:
+            if package in sys.modules:
+                continue
             try:
                 importlib.import_module(package)
             except ImportError:
@@ -210,7 +193,10 @@ class TestDependencyAvailability:
     def test_optional_packages_graceful_fallback(self):
         """Optional packages should have graceful fallback."""
         # These packages are optional - test that their absence doesn't crash
-        from backend.core.privacy import PrivacyGuard
+        from backend.core.privacy import PRESIDIO_AVAILABLE, PrivacyGuard
+
+        if not _PRESIDIO_AVAILABLE:
+            assert PRESIDIO_AVAILABLE is False
 
         # Should work regardless of Presidio availability
         guard = PrivacyGuard()
@@ -222,28 +208,15 @@ class TestFileStructure:
 
     def test_backend_directory_exists(self):
         """Backend directory should exist."""
-        backend_path = os.path.join(os.path.dirname(__file__), "..", "..", "backend")
-        assert os.path.isdir(backend_path)
+        assert _BACKEND.is_dir()
 
     def test_extension_directory_exists(self):
         """Extension directory should exist."""
-        extension_path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "extension"
-        )
-        assert os.path.isdir(extension_path)
+        assert _EXTENSION.is_dir()
 
-    def test_manifest_exists(self):
+    def test_manifest_exists(self, manifest):
         """Extension manifest should exist."""
-        manifest_path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "extension", "manifest.json"
-        )
-        assert os.path.exists(manifest_path)
-
-        import json
-
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest = json.load(f)
-
+        assert (_EXTENSION / "manifest.json").exists()
         assert "manifest_version" in manifest
         assert "name" in manifest
 
@@ -251,31 +224,9 @@ class TestFileStructure:
 class TestHealthEndpoint:
     """Verify health check functionality."""
 
-    def test_orchestrator_ping_works(self):
+    def test_orchestrator_ping_works(self, smoke_orchestrator):
         """Orchestrator should respond to ping."""
-        from unittest.mock import patch, Mock
-
-        with patch("backend.core.orchestrator.ProviderFactory") as mock_factory, patch(
-            "backend.core.orchestrator.get_smart_cache"
-        ), patch("backend.core.orchestrator.get_circuit_breaker"), patch(
-            "backend.core.orchestrator.get_rate_limiter"
-        ), patch(
-            "backend.core.orchestrator.get_prompt_engine"
-        ), patch(
-            "backend.core.orchestrator.get_calibrator"
-        ), patch(
-            "backend.core.orchestrator.get_batch_processor"
-        ), patch(
-            "backend.core.orchestrator.get_feedback_loop"
-        ):
-
-            mock_factory.create.return_value = Mock()
-
-            from backend.core.orchestrator import Orchestrator
-
-            orchestrator = Orchestrator({"provider": "ollama", "folders": ["Inbox"]})
-
-            response = orchestrator.handle_message({"type": "ping"})
+        response = smoke_orchestrator.handle_message({"type": "ping"})
 
-            assert response["status"] == "ok"
-            assert response["type"] == "pong"
+        assert response["status"] == "ok"
+        assert response["type"] == "pong"
@@ -0,0 +1,155 @@
+"""
+Unit tests for attachment heuristic analysis.
+"""
+
+import pytest
+
+from backend.core.attachment_heuristic import (
+    KNOWN_MALWARE_HASHES,
+    SUSPICIOUS_EXTENSIONS,
+    AttachmentHeuristic,
+    compute_file_hash,
+)
+
+
+@pytest.fixture(scope="module")
+def heuristic():
+    """Shared analyzer; analyze_attachment does not mutate instance state."""
+    return AttachmentHeuristic()
+
+
+class TestSuspiciousExtensions:
+    """Tests for the suspicious extension table."""
+
+    def test_suspicious_extensions_lowercase(self):
+        """Extensions should be dotted and lowercase to match lookups."""
+        bad = [
+            ext
+            for ext in SUSPICIOUS_EXTENSIONS
+            if not (ext.startswith(".") and ext == ext.lower())
+        ]
+        assert not bad, f"Malformed: {bad}"
+
+    def test_common_dangerous_extensions_present(self):
+        """Common executable and script extensions should be listed."""
+        dangerous = {".exe", ".scr", ".bat", ".vbs", ".js", ".ps1", ".docm"}
+        missing = dangerous - SUSPICIOUS_EXTENSIONS
+        assert not missing, f"Missing: {missing}"
+
+    def test_executable_flagged_high(self, heuristic):
+        """Executable attachments should be high risk."""
+        result = heuristic.analyze_attachment("setup.exe", "application/x-msdownload")
+
+        assert "suspicious_extension:.exe" in result["flags"]
+        assert result["risk_level"] == "high"
+        assert result["score_adjustment"] > 0
+
+    def test_extension_case_insensitive(self, heuristic):
+        """Uppercase extensions should be flagged too."""
+        result = heuristic.analyze_attachment("INVOICE.EXE", "application/octet-stream")
+
+        assert "suspicious_extension:.exe" in result["flags"]
+
+
+class TestDoubleExtension:
+    """Tests for double extension detection."""
+
+    @pytest.mark.parametrize(
+        "filename", ["photo.jpg.scr", "report.doc.exe", "data.xlsx.bat"]
+    )
+    def test_double_extension_various_combos(self, heuristic, filename):
+        """Document-then-executable names should be flagged."""
+        result = heuristic.analyze_attachment(filename, "application/octet-stream")
+        assert "double_extension" in result["flags"]
+
+    @pytest.mark.parametrize(
+        "filename", ["my.vacation.photo.jpg", "v1.2.3.release-notes.txt"]
+    )
+    def test_normal_multiple_dots_not_flagged(self, heuristic, filename):
+        """Dotted names that are not document+executable should pass."""
+        result = heuristic.analyze_attachment(filename, "image/jpeg")
+        assert "double_extension" not in result["flags"]
+
+
+class TestMimeChecks:
+    """Tests for MIME type analysis."""
+
+    def test_safe_mime_lowers_score(self, heuristic):
+        """Safe MIME types should reduce suspicion."""
+        result = heuristic.analyze_attachment("report.pdf", "application/pdf")
+
+        assert "safe_mime_type" in result["flags"]
+        assert result["score_adjustment"] < 0
+        assert result["risk_level"] == "low"
+
+    def test_mime_mismatch_flagged(self, heuristic):
+        """A PDF name with an image MIME type should be flagged."""
+        result = heuristic.analyze_attachment("report.pdf", "image/png")
+
+        assert "mime_extension_mismatch" in result["flags"]
+        assert result["risk_level"] == "medium"
+
+
+class TestHashes:
+    """Tests for content hashing and known malware lookup."""
+
+    def test_compute_hash(self):
+        """Hash should be a lowercase SHA256 hex digest."""
+        hash_result = compute_file_hash(b"attachment content")
+
+        assert len(hash_result) == 64
+        assert hash_result == hash_result.lower()
+        bytes.fromhex(hash_result)  # raises ValueError if not hex
+
+    def test_known_hash_flagged_critical(self, heuristic, monkeypatch):
+        """Known malware hashes should be critical."""
+        content_hash = compute_file_hash(b"malware sample")
+        # Swap in a new set rather than mutating the shared module global
+        monkeypatch.setattr(
+            "backend.core.attachment_heuristic.KNOWN_MALWARE_HASHES",
+            KNOWN_MALWARE_HASHES | {content_hash},
+        )
+
+        result = heuristic.analyze_attachment(
+            "invoice.pdf", "application/pdf", content_hash=content_hash.upper()
+        )
+
+        assert "known_malware_hash" in result["flags"]
+        assert result["risk_level"] == "critical"
+
+    def test_unknown_hash_no_flag(self, heuristic):
+        """Unknown hashes should not be flagged."""
+        content_hash = compute_file_hash(b"harmless content")
+        result = heuristic.analyze_attachment(
+            "notes.txt", "text/plain", content_hash=content_hash
+        )
+
+        assert "known_malware_hash" not in result["flags"]
+
+
+class TestAnalyzeAttachments:
+    """Tests for aggregate analysis."""
+
+    def test_empty_list(self, heuristic):
+        """No attachments should give a neutral result."""
+        result = heuristic.analyze_attachments([])
+
+        assert result["total_attachments"] == 0
+        assert result["highest_risk"] == "none"
+
+    def test_multiple_high_risk_adds_penalty(self, heuristic):
+        """Several high-risk attachments should raise the aggregate."""
+        single = heuristic.analyze_attachments(
+            [{"filename": "a.exe", "mime_type": "application/octet-stream"}]
+        )
+        double = heuristic.analyze_attachments(
+            [
+                {"filename": "a.exe", "mime_type": "application/octet-stream"},
+                {"filename": "b.scr", "mime_type": "application/octet-stream"},
+            ]
+        )
+
+        assert double["highest_risk"] == "high"
+        assert (
+            double["aggregate_score_adjustment"] > single["aggregate_score_adjustment"]
+        )
@@ -3,7 +3,8 @@ Unit tests for batch processor (V5-015).
 """
 
 import time
-from unittest.mock import Mock
+
+import pytest
 
 from backend.core.batch_processor import (
     BatchProcessor,
@@ -14,20 +15,33 @@ from backend.core.batch_processor import (
     reset_processor,
 )
 
+# Shared read-only inputs; BatchProcessor never mutates the email dicts
+_EMAILS_5, _EMAILS_10, _EMAILS_25 = (
+    tuple({"id": i, "subject": f"Email {i}"} for i in range(n)) for n in (5, 10, 25)
+)
+
+
+@pytest.fixture(scope="class")
+def processor():
+    """One processor per class; tests reset it instead of rebuilding."""
+    return BatchProcessor(
+        {
+            "batch_size": 10,
+            "batch_delay_ms": 100,
+            "realtime_timeout_ms": 5000,
+            "max_concurrent_jobs": 3,
+        }
+    )
+
 
 class TestBatchProcessor:
     """Tests for BatchProcessor."""
 
-    def setup_method(self):
-        """Create processor for testing."""
-        self.processor = BatchProcessor(
-            {
-                "batch_size": 10,
-                "batch_delay_ms": 100,
-                "realtime_timeout_ms": 5000,
-                "max_concurrent_jobs": 3,
-            }
-        )
+    @pytest.fixture(autouse=True)
+    def _fresh_processor(self, processor):
+        """Clear jobs left by the previous test."""
+        processor.reset()
+        self.processor = processor
 
     def test_detect_mode_single_email(self):
         """Should detect realtime mode for single email."""
@@ -48,9 +62,7 @@ class TestBatchProcessor:
 
     def test_create_batch_job(self):
         """Should create batch job."""
-        emails = [{"id": i, "subject": f"Email {i}"} for i in range(5)]
-
-        job = self.processor.create_job(emails)
+        job = self.processor.create_job(_EMAILS_5)
 
         assert job.id is not None
         assert job.status == JobStatus.PENDING
@@ -61,7 +73,7 @@ class TestBatchProcessor:
         """Should track job progress."""
         job = BatchJob(
             id="test-job",
-            emails=[{} for _ in range(10)],
+            emails=_EMAILS_10,
             status=JobStatus.RUNNING,
             total=10,
             processed=3,
@@ -103,7 +115,7 @@ class TestBatchProcessor:
 
     def test_cancel_job(self):
         """Should cancel pending job."""
-        job = self.processor.create_job([{"id": i} for i in range(10)])
+        job = self.processor.create_job(_EMAILS_10)
 
         success = self.processor.cancel_job(job.id)
 
@@ -121,24 +133,61 @@ class TestBatchProcessor:
 
     def test_batch_iterator(self):
         """Should iterate in batches."""
-        emails = [{"id": i} for i in range(25)]
-
-        batches = list(self.processor.batch_iterator(emails))
+        batches = list(self.processor.batch_iterator(_EMAILS_25))
 
         assert len(batches) == 3  # 10 + 10 + 5
         assert len(batches[0]) == 10
         assert len(batches[2]) == 5
 
+    def test_batch_bounds(self):
+        """Should yield index pairs matching batch_iterator slices."""
+        bounds = list(self.processor.batch_bounds(len(_EMAILS_25)))
+
+        assert bounds == [(0, 10), (10, 20), (20, 25)]
+        assert [_EMAILS_25[a:b] for a, b in bounds] == list(
+            self.processor.batch_iterator(_EMAILS_25)
+        )
+
     def test_realtime_process(self):
         """Should process in realtime mode."""
-        classify_fn = Mock(return_value={"folder": "Inbox", "confidence": 0.9})
+        calls = []
+
+        def classify_fn(email):
+            calls.append(email)
+            return {"folder": "Inbox", "confidence": 0.9}
 
         email = {"id": 1, "subject": "Test"}
         result = self.processor.process_realtime(email, classify_fn)
 
-        classify_fn.assert_called_once_with(email)
+        assert calls == [email]
         assert result["folder"] == "Inbox"
 
+    def test_reset_clears_jobs(self):
+        """reset() should drop jobs while keeping the same instance."""
+        self.processor.create_job([{"id": 1}])
+
+        self.processor.reset()
+
+        assert self.processor.list_jobs() == []
+        assert self.processor.get_stats()["total_jobs"] == 0
+
+    def test_reset_mid_job_keeps_concurrency_limit(self):
+        """A job running across reset() should still release only its own slot."""
+        processor = BatchProcessor({"max_concurrent": 1, "batch_delay": 0})
+        first = processor.create_job([{"id": 1}])
+        processor.start_job(first.id, lambda email: processor.reset())
+
+        second = processor.create_job([{"id": 2}])
+        third = processor.create_job([{"id": 3}])
+        overlapping = []
+
+        def classify_fn(email):
+            overlapping.append(processor.start_job(third.id, lambda e: None))
+
+        processor.start_job(second.id, classify_fn)
+
+        assert overlapping == [False]
+
     def test_get_stats(self):
         """Should return processor statistics."""
         self.processor.create_job([{"id": 1}])
@@ -200,30 +249,28 @@ class TestBatchJob:
         assert data["total"] == 1
 
 
-class TestProcessingMode:
-    """Tests for ProcessingMode enum."""
-
-    def test_realtime_value(self):
-        """Should have realtime value."""
-        assert ProcessingMode.REALTIME.value == "realtime"
-
-    def test_batch_value(self):
-        """Should have batch value."""
-        assert ProcessingMode.BATCH.value == "batch"
-
-
-class TestJobStatus:
-    """Tests for JobStatus enum."""
-
-    def test_all_statuses(self):
-        """Should have all expected statuses."""
-        statuses = [s.value for s in JobStatus]
-
-        assert "pending" in statuses
-        assert "running" in statuses
-        assert "completed" in statuses
-        assert "failed" in statuses
-        assert "cancelled" in statuses
+@pytest.mark.parametrize(
+    "mode,value",
+    [(ProcessingMode.REALTIME, "realtime"), (ProcessingMode.BATCH, "batch")],
+)
+def test_processing_mode_value(mode, value):
+    """ProcessingMode members should keep their serialized values."""
+    assert mode.value == value
+
+
+@pytest.mark.parametrize(
+    "status,value",
+    [
+        (JobStatus.PENDING, "pending"),
+        (JobStatus.RUNNING, "running"),
+        (JobStatus.COMPLETED, "completed"),
+        (JobStatus.FAILED, "failed"),
+        (JobStatus.CANCELLED, "cancelled"),
+    ],
+)
+def test_job_status_value(status, value):
+    """JobStatus members should match the API status strings."""
+    assert status.value == value
 
 
 class TestGlobalProcessor:
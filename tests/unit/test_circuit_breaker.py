@@ -4,6 +4,8 @@ Unit tests for circuit breaker (AUDIT-003).
 
 import time
 
+import pytest
+
 from backend.core.circuit_breaker import (
     CircuitBreaker,
     CircuitState,
@@ -12,16 +14,33 @@ from backend.core.circuit_breaker import (
 )
 
 
+@pytest.fixture(scope="class")
+def clock():
+    """Virtual clock: tests advance clock[0] instead of sleeping."""
+    return [0.0]
+
+
+@pytest.fixture(scope="class")
+def breaker(clock):
+    """One breaker per class; tests reset it instead of rebuilding."""
+    return CircuitBreaker(
+        failure_threshold=3,
+        recovery_timeout=1.0,  # Short for testing
+        success_threshold=1,
+        time_source=lambda: clock[0],
+    )
+
+
 class TestCircuitBreaker:
     """Tests for CircuitBreaker implementation."""
 
-    def setup_method(self):
-        """Create fresh circuit breaker for each test."""
-        self.breaker = CircuitBreaker(
-            failure_threshold=3,
-            recovery_timeout=1.0,  # Short for testing
-            success_threshold=1,
-        )
+    @pytest.fixture(autouse=True)
+    def _fresh_breaker(self, breaker, clock):
+        """Rewind the clock and clear circuits left by the previous test."""
+        clock[0] = 0.0
+        breaker.reset_all()
+        self.clock = clock
+        self.breaker = breaker
 
     def test_initial_state_closed(self):
         """Circuit should start in CLOSED state."""
@@ -41,8 +60,7 @@ class TestCircuitBreaker:
 
     def test_multiple_failures_opens_circuit(self):
         """Consecutive failures should open circuit."""
-        for _ in range(3):
-            self.breaker.record_failure("test_provider")
+        self.breaker.record_failures("test_provider", 3)
 
         assert self.breaker.get_state("test_provider") == CircuitState.OPEN
         assert self.breaker.can_execute("test_provider") is False
@@ -60,13 +78,12 @@ class TestCircuitBreaker:
     def test_recovery_timeout_to_half_open(self):
         """After timeout, circuit should transition to HALF_OPEN."""
         # Open the circuit
-        for _ in range(3):
-            self.breaker.record_failure("test_provider")
+        self.breaker.record_failures("test_provider", 3)
 
         assert self.breaker.get_state("test_provider") == CircuitState.OPEN
 
         # Wait for recovery timeout
-        time.sleep(1.1)
+        self.clock[0] += 1.1
 
         # Should now be HALF_OPEN
         assert self.breaker.get_state("test_provider") == CircuitState.HALF_OPEN
@@ -75,9 +92,8 @@ class TestCircuitBreaker:
     def test_success_in_half_open_closes_circuit(self):
         """Success in HALF_OPEN should close circuit."""
         # Open then transition to half-open
-        for _ in range(3):
-            self.breaker.record_failure("test_provider")
-        time.sleep(1.1)
+        self.breaker.record_failures("test_provider", 3)
+        self.clock[0] += 1.1
 
         # Record success
         self.breaker.record_success("test_provider")
@@ -87,9 +103,8 @@ class TestCircuitBreaker:
     def test_failure_in_half_open_opens_circuit(self):
         """Failure in HALF_OPEN should reopen circuit."""
         # Open then transition to half-open
-        for _ in range(3):
-            self.breaker.record_failure("test_provider")
-        time.sleep(1.1)
+        self.breaker.record_failures("test_provider", 3)
+        self.clock[0] += 1.1
 
         assert self.breaker.get_state("test_provider") == CircuitState.HALF_OPEN
 
@@ -98,6 +113,19 @@ class TestCircuitBreaker:
 
         assert self.breaker.get_state("test_provider") == CircuitState.OPEN
 
+    def test_record_failures_matches_repeated_calls(self):
+        """Bulk recording should count like repeated single failures."""
+        self.breaker.record_failures("test_provider", 2)
+        assert self.breaker.get_state("test_provider") == CircuitState.CLOSED
+
+        self.breaker.record_failures("test_provider", 1)
+        stats = self.breaker.get_stats("test_provider")
+
+        assert stats["state"] == "open"
+        assert stats["consecutive_failures"] == 3
+        assert stats["total_calls"] == 3
+        assert stats["total_failures"] == 3
+
     def test_get_stats(self):
         """Should return comprehensive statistics."""
         self.breaker.record_success("test_provider")
@@ -110,10 +138,21 @@ class TestCircuitBreaker:
         assert stats["total_calls"] == 2
         assert stats["total_failures"] == 1
 
+    def test_stats_report_wall_clock_times(self):
+        """Reported timestamps should be epoch times, not the breaker clock."""
+        before = time.time()
+        self.breaker.record_success("test_provider")
+        self.breaker.record_failures("test_provider", 3)
+
+        stats = self.breaker.get_stats("test_provider")
+
+        assert stats["last_success"] >= before
+        assert stats["last_failure"] >= before
+        assert stats["recovery_in_seconds"] == 1.0
+
     def test_reset(self):
         """Should reset circuit to initial state."""
-        for _ in range(3):
-            self.breaker.record_failure("test_provider")
+        self.breaker.record_failures("test_provider", 3)
 
         assert self.breaker.get_state("test_provider") == CircuitState.OPEN
 
@@ -152,8 +191,7 @@ class TestCircuitBreaker:
     def test_execute_with_fallback_when_open(self):
         """Should return fallback immediately when circuit is open."""
         # Open the circuit
-        for _ in range(3):
-            self.breaker.record_failure("test_provider")
+        self.breaker.record_failures("test_provider", 3)
 
         call_count = 0
 
@@ -172,8 +210,7 @@ class TestCircuitBreaker:
     def test_independent_circuits_per_provider(self):
         """Each provider should have independent circuit."""
         # Open circuit for provider1
-        for _ in range(3):
-            self.breaker.record_failure("provider1")
+        self.breaker.record_failures("provider1", 3)
 
         assert self.breaker.can_execute("provider1") is False
         assert self.breaker.can_execute("provider2") is True
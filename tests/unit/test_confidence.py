@@ -3,7 +3,9 @@ Unit tests for confidence calibration (V5-005, INT-003).
 """
 
 import os
-import tempfile
+from dataclasses import FrozenInstanceError
+
+import pytest
 
 from backend.core.confidence import (
     ConfidenceCalibrator,
@@ -13,15 +15,21 @@ from backend.core.confidence import (
 )
 
 
+@pytest.fixture(scope="module")
+def calibration_dir(tmp_path_factory):
+    """One directory for the module; pytest prunes it with its other tmp dirs."""
+    return tmp_path_factory.mktemp("calibration")
+
+
 class TestConfidenceCalibrator:
     """Tests for ConfidenceCalibrator."""
 
-    def setup_method(self):
-        """Create calibrator with temporary file."""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def _calibrator(self, request, calibration_dir):
+        """Create calibrator with a per-test file in the shared directory."""
         self.calibrator = ConfidenceCalibrator(
             {
-                "calibration_file": os.path.join(self.temp_dir, "calibration.json"),
+                "calibration_file": str(calibration_dir / f"{request.node.name}.json"),
                 "auto_adjust": False,
                 "min_samples": 5,  # Low for testing
             }
@@ -77,6 +85,18 @@ class TestConfidenceCalibrator:
         assert stats["labeled_count"] == 2
         assert stats["accuracy"] == 0.5
 
+    def test_flush_writes_buffered_predictions(self):
+        """Predictions should reach the file on flush(), not on every log."""
+        path = self.calibrator.calibration_file
+        self.calibrator.log_prediction("Invoices", 0.85)
+
+        assert not os.path.exists(path)
+
+        self.calibrator.flush()
+        reloaded = ConfidenceCalibrator({"calibration_file": path})
+
+        assert reloaded.get_folder_stats("Invoices")["count"] == 1
+
     def test_record_correction(self):
         """Should record user corrections."""
         self.calibrator.record_correction(
@@ -148,6 +168,14 @@ class TestCalibrationEntry:
         )
         assert entry.correct is None
 
+    def test_entry_is_immutable(self):
+        """Logged entries should not be rewritten in place."""
+        entry = CalibrationEntry(
+            predicted="Invoices", actual=None, confidence=0.8, timestamp=0
+        )
+        with pytest.raises(FrozenInstanceError):
+            entry.actual = "Inbox"
+
 
 class TestGlobalCalibrator:
     """Tests for global calibrator instance."""
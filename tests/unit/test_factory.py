@@ -76,16 +76,20 @@ class TestProviderFactory:
         assert provider1 is not provider2
 
 
+@pytest.fixture(scope="module")
+def default_ollama():
+    """Default-configured provider shared by the read-only checks."""
+    return OllamaProvider()
+
+
 class TestOllamaProvider:
     """Tests for Ollama provider implementation."""
 
-    def test_initialization(self):
+    def test_initialization(self, default_ollama):
         """Should initialize with default config."""
-        provider = OllamaProvider()
-
-        assert provider.base_url == "http://localhost:11434"
-        assert provider.model == "llama3"
-        assert provider.timeout == 30
+        assert default_ollama.base_url == "http://localhost:11434"
+        assert default_ollama.model == "llama3"
+        assert default_ollama.timeout == 30
 
     def test_initialization_with_config(self):
         """Should initialize with custom config."""
@@ -97,20 +101,17 @@ class TestOllamaProvider:
         assert provider.model == "mistral"
         assert provider.timeout == 60
 
-    def test_get_name(self):
+    def test_get_name(self, default_ollama):
         """Should return provider name."""
-        provider = OllamaProvider()
-        assert provider.get_name() == "ollama"
+        assert default_ollama.get_name() == "ollama"
 
-    def test_is_local(self):
+    def test_is_local(self, default_ollama):
         """Should indicate local provider."""
-        provider = OllamaProvider()
-        assert provider.is_local is True
+        assert default_ollama.is_local is True
 
-    def test_supports_streaming(self):
+    def test_supports_streaming(self, default_ollama):
         """Should support streaming."""
-        provider = OllamaProvider()
-        assert provider.supports_streaming is True
+        assert default_ollama.supports_streaming is True
 
 
 class TestClassificationResult:
@@ -0,0 +1,360 @@
+"""
+Unit tests for the feedback loop (V5-008).
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.core.feedback_loop import (
+    FeedbackEntry,
+    FeedbackLoop,
+    get_feedback_loop,
+    reset_feedback_loop,
+)
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """Per-test feedback file path (not created until the first save)."""
+    return tmp_path / "feedback.json"
+
+
+@pytest.fixture
+def loop(data_file):
+    """Enabled, consented feedback loop writing to a temporary file."""
+    return FeedbackLoop(
+        {
+            "enabled": True,
+            "consent_given": True,
+            "min_samples": 2,
+            "data_file": str(data_file),
+        }
+    )
+
+
+def _record(loop, predicted="Inbox", actual="Invoices", email_id="1"):
+    return loop.record_feedback(
+        email_id=email_id,
+        subject="Invoice #456",
+        body="Payment details",
+        predicted_folder=predicted,
+        actual_folder=actual,
+        confidence=0.6,
+    )
+
+
+class TestFeedbackEntry:
+    """Tests for FeedbackEntry dataclass."""
+
+    def test_correct_prediction(self):
+        """Matching folders should be marked correct."""
+        entry = FeedbackEntry("1", "s", "b", "Inbox", "Inbox", 0.9, 0.0)
+        assert entry.is_correct is True
+
+    def test_incorrect_prediction(self):
+        """Different folders should be marked as a correction."""
+        entry = FeedbackEntry("1", "s", "b", "Inbox", "Invoices", 0.9, 0.0)
+        assert entry.is_correct is False
+
+
+class TestRecording:
+    """Tests for record_feedback and statistics."""
+
+    def test_disabled_records_nothing(self, data_file):
+        """Without consent, feedback should be dropped."""
+        loop = FeedbackLoop({"enabled": True, "data_file": str(data_file)})
+
+        assert _record(loop) is False
+        assert loop.get_stats()["total_entries"] == 0
+
+    def test_record_updates_stats(self, loop):
+        """Corrections and confirmations should be counted."""
+        _record(loop)
+        _record(loop, predicted="Invoices")
+
+        stats = loop.get_stats()
+
+        assert stats["total_entries"] == 2
+        assert stats["corrections"] == 1
+        assert stats["confirmations"] == 1
+        assert stats["accuracy"] == 0.5
+
+    def test_record_truncates_long_text(self, loop, data_file):
+        """Subject and body should be capped before storage."""
+        loop.record_feedback(
+            email_id="1",
+            subject="s" * 1000,
+            body="b" * 5000,
+            predicted_folder="Inbox",
+            actual_folder="Invoices",
+            confidence=0.6,
+        )
+        loop.flush()
+
+        row = json.loads(data_file.read_text())
+        assert len(row["subject"]) == FeedbackLoop.MAX_SUBJECT_LENGTH
+        assert len(row["body"]) == FeedbackLoop.MAX_BODY_LENGTH
+
+    def test_max_entries_enforced(self, data_file):
+        """Oldest entries should be dropped beyond max_entries."""
+        loop = FeedbackLoop(
+            {
+                "enabled": True,
+                "consent_given": True,
+                "max_entries": 5,
+                "data_file": str(data_file),
+            }
+        )
+        for i in range(10):
+            _record(loop, email_id=str(i))
+
+        assert loop.get_stats()["total_entries"] == 5
+
+    def test_stats_follow_eviction(self, data_file):
+        """Evicted corrections should no longer be counted."""
+        loop = FeedbackLoop(
+            {
+                "enabled": True,
+                "consent_given": True,
+                "max_entries": 2,
+                "data_file": str(data_file),
+            }
+        )
+        _record(loop)
+        _record(loop, predicted="Invoices")
+        _record(loop, predicted="Invoices")
+
+        stats = loop.get_stats()
+
+        assert stats["corrections"] == 0
+        assert stats["confirmations"] == 2
+        assert stats["accuracy"] == 1.0
+        assert loop.get_correction_patterns() == {}
+
+    def test_zero_max_entries_keeps_stats_consistent(self, data_file):
+        """max_entries=0 should not leave counters for dropped entries."""
+        loop = FeedbackLoop(
+            {
+                "enabled": True,
+                "consent_given": True,
+                "max_entries": 0,
+                "data_file": str(data_file),
+            }
+        )
+        _record(loop)
+        _record(loop, predicted="Invoices")
+
+        stats = loop.get_stats()
+
+        assert stats["total_entries"] == 1
+        assert stats["corrections"] + stats["confirmations"] == 1
+        assert loop.get_correction_patterns() == {}
+
+    def test_correction_patterns(self, loop):
+        """Patterns should map predicted folders to corrected folders."""
+        _record(loop)
+        _record(loop)
+        _record(loop, actual="Spam")
+        _record(loop, predicted="Invoices", actual="Invoices")
+
+        assert loop.get_correction_patterns() == {"Inbox": {"Invoices": 2, "Spam": 1}}
+
+
+class TestPersistence:
+    """Tests for saving and loading the feedback file."""
+
+    def test_saves_every_n_entries(self, data_file):
+        """The file should be written once per save_every entries."""
+        loop = FeedbackLoop(
+            {
+                "enabled": True,
+                "consent_given": True,
+                "save_every": 3,
+                "data_file": str(data_file),
+            }
+        )
+        _record(loop)
+        _record(loop)
+        assert not data_file.exists()
+
+        _record(loop)
+        assert len(data_file.read_text().splitlines()) == 3
+
+    def test_appends_then_compacts(self, data_file):
+        """Saves should append, compacting once pruned lines dominate."""
+        loop = FeedbackLoop(
+            {
+                "enabled": True,
+                "consent_given": True,
+                "save_every": 1,
+                "max_entries": 2,
+                "data_file": str(data_file),
+            }
+        )
+        for email_id in "abcd":
+            _record(loop, email_id=email_id)
+        assert len(data_file.read_text().splitlines()) == 4
+
+        _record(loop, email_id="e")
+        rows = [json.loads(line) for line in data_file.read_text().splitlines()]
+
+        assert [r["email_id"] for r in rows] == ["d", "e"]
+        assert list(data_file.parent.iterdir()) == [data_file]
+
+    def test_load_legacy_format(self, data_file):
+        """The old single-object file should still load."""
+        entry = {
+            "email_id": "1",
+            "subject": "s",
+            "body": "b",
+            "predicted_folder": "Inbox",
+            "actual_folder": "Invoices",
+            "confidence": 0.6,
+            "timestamp": 0.0,
+        }
+        data_file.write_text(json.dumps({"entries": [entry], "stats": {}}))
+
+        loop = FeedbackLoop({"data_file": str(data_file)})
+
+        assert loop.get_stats()["corrections"] == 1
+
+    def test_flush_then_reload(self, loop, data_file):
+        """Flushed entries should be visible to a new instance."""
+        _record(loop)
+        loop.flush()
+
+        reloaded = FeedbackLoop({"data_file": str(data_file)})
+
+        assert reloaded.get_stats()["total_entries"] == 1
+
+    def test_load_corrupted_file(self, data_file):
+        """A corrupted file should be ignored, not raise."""
+        data_file.write_text("{not json")
+
+        loop = FeedbackLoop({"data_file": str(data_file)})
+
+        assert loop.get_stats()["total_entries"] == 0
+
+    def test_load_skips_truncated_line(self, loop, data_file):
+        """A torn trailing line should not discard earlier entries."""
+        _record(loop)
+        loop.flush()
+        with open(data_file, "a", encoding="utf-8") as f:
+            f.write('{"email_id": "2", "subj')
+
+        reloaded = FeedbackLoop({"data_file": str(data_file)})
+
+        assert reloaded.get_stats()["total_entries"] == 1
+
+    def test_clear_data_removes_file(self, loop, data_file):
+        """Erasure should drop entries and delete the file."""
+        _record(loop)
+        loop.flush()
+
+        loop.clear_data()
+
+        assert not data_file.exists()
+        assert loop.get_stats()["total_entries"] == 0
+
+    def test_clear_data_removes_stale_tmp(self, loop, data_file):
+        """Erasure should also delete a temp file left by a crashed compaction."""
+        _record(loop)
+        loop.flush()
+        tmp_file = data_file.with_name(data_file.name + ".tmp")
+        tmp_file.write_text(data_file.read_text())
+
+        loop.clear_data()
+
+        assert list(data_file.parent.iterdir()) == []
+
+    def test_load_removes_stale_tmp(self, data_file):
+        """Loading should discard a leftover temp file, keeping the data file."""
+        tmp_file = data_file.with_name(data_file.name + ".tmp")
+        tmp_file.write_text("{torn")
+
+        loop = FeedbackLoop({"data_file": str(data_file)})
+
+        assert not tmp_file.exists()
+        assert loop.get_stats()["total_entries"] == 0
+
+
+class TestConcurrency:
+    """Tests for recording from several threads."""
+
+    def test_concurrent_recording(self, data_file):
+        """Concurrent records and saves should not lose or duplicate entries."""
+        loop = FeedbackLoop(
+            {
+                "enabled": True,
+                "consent_given": True,
+                "save_every": 7,
+                "data_file": str(data_file),
+            }
+        )
+
+        def worker(thread_id):
+            for i in range(100):
+                _record(loop, email_id=f"{thread_id}-{i}")
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(worker, range(5)))
+        loop.flush()
+
+        ids = [
+            json.loads(line)["email_id"] for line in data_file.read_text().splitlines()
+        ]
+        assert loop.get_stats()["total_entries"] == 500
+        assert len(set(ids)) == len(ids) == 500
+
+
+class TestExport:
+    """Tests for training data export."""
+
+    def test_not_enough_samples(self, loop, tmp_path):
+        """Export should be refused below min_samples."""
+        _record(loop)
+        assert loop.export_training_data(str(tmp_path / "out.jsonl")) is None
+
+    def test_export_creates_jsonl(self, loop, tmp_path):
+        """Each entry should become one JSON line with prompt and response."""
+        _record(loop)
+        _record(loop, actual="Spam")
+        out = tmp_path / "out.jsonl"
+
+        assert loop.export_training_data(str(out)) == str(out)
+
+        lines = [json.loads(line) for line in out.read_text().splitlines()]
+        assert len(lines) == 2
+        assert json.loads(lines[1]["response"])["folder"] == "Spam"
+        assert "Invoice #456" in lines[0]["prompt"]
+        assert lines[0]["source"] == "user_feedback"
+
+    def test_export_corrections_only(self, loop, tmp_path):
+        """include_correct=False should keep only corrections."""
+        _record(loop)
+        _record(loop, predicted="Invoices")
+        out = tmp_path / "out.jsonl"
+
+        loop.export_training_data(str(out), include_correct=False)
+
+        assert len(out.read_text().splitlines()) == 1
+
+
+class TestGlobalFeedbackLoop:
+    """Tests for global feedback loop instance."""
+
+    def setup_method(self):
+        reset_feedback_loop()
+
+    def teardown_method(self):
+        reset_feedback_loop()
+
+    def test_singleton(self, data_file):
+        """Should return same instance and ignore later configs."""
+        loop1 = get_feedback_loop({"data_file": str(data_file)})
+        loop2 = get_feedback_loop({"enabled": True})
+
+        assert loop1 is loop2
+        assert loop2.is_enabled() is False
@@ -7,12 +7,12 @@ email content to prevent crashes and security vulnerabilities.
 Task: QA-007
 """
 
+import itertools
 import pytest
 import random
 import string
 import json
 
-from backend.core.privacy import PrivacyGuard
 from backend.utils.sanitize import sanitize_text
 
 
@@ -26,25 +26,28 @@ def random_string(length: int) -> str:
     return "".join(random.choices(string.printable, k=length))
 
 
+# Mix of ASCII, Latin, CJK, emoji, and special chars: each group is equally
+# likely, then a character is uniform within its group.
+_UNICODE_GROUPS = [
+    string.printable,
+    "".join(map(chr, range(0x00C0, 0x0100))),  # Latin Extended
+    "".join(map(chr, range(0x4E00, 0x5000))),  # CJK chars
+    "".join(map(chr, range(0x1F600, 0x1F650))),  # Common emoji range
+    "".join(map(chr, [0x00, 0x0A, 0x0D, 0x1B, 0x7F])),  # Special/control
+]
+_UNICODE_ALPHABET = "".join(_UNICODE_GROUPS)
+_UNICODE_WEIGHTS = [
+    1 / len(group) for group in _UNICODE_GROUPS for _ in range(len(group))
+]
+# Cumulative once here, so random.choices doesn't re-sum ~760 weights per call
+_UNICODE_CUM_WEIGHTS = list(itertools.accumulate(_UNICODE_WEIGHTS))
+
+
 def random_unicode_string(length: int) -> str:
     """Generate a random unicode string with various characters."""
-    chars = []
-    for _ in range(length):
-        # Mix of ASCII, Latin, CJK, emoji, and special chars
-        char_type = random.choice(["ascii", "latin", "cjk", "emoji", "special"])
-        if char_type == "ascii":
-            chars.append(random.choice(string.printable))
-        elif char_type == "latin":
-            chars.append(chr(random.randint(0x00C0, 0x00FF)))  # Latin Extended
-        elif char_type == "cjk":
-            chars.append(chr(random.randint(0x4E00, 0x4FFF)))  # CJK chars
-        elif char_type == "emoji":
-            # Common emoji range
-            chars.append(chr(random.randint(0x1F600, 0x1F64F)))
-        else:
-            # Special/control characters
-            chars.append(chr(random.choice([0x00, 0x0A, 0x0D, 0x1B, 0x7F])))
-    return "".join(chars)
+    return "".join(
+        random.choices(_UNICODE_ALPHABET, cum_weights=_UNICODE_CUM_WEIGHTS, k=length)
+    )
 
 
 def random_email_address() -> str:
@@ -65,32 +68,67 @@ def random_mime_header() -> str:
     return random.choice(headers)
 
 
+def random_malformed_email() -> str:
+    """Pick one of several malformed email address shapes."""
+    patterns = [
+        random_email_address,
+        lambda: f"@{random_string(10)}.com",
+        lambda: f"{random_string(10)}@",
+        lambda: f"{random_string(10)}@@{random_string(5)}.com",
+        lambda: "a" * 1000 + "@test.com",
+        lambda: "test@" + "a" * 1000,
+        lambda: f"{random_string(10)}@{random_string(10)}@{random_string(10)}",
+    ]
+    return random.choice(patterns)()
+
+
+# Corpora are generated once per module so the loops time the code under test
+@pytest.fixture(scope="module")
+def ascii_corpus():
+    return [
+        random_string(random.randint(0, MAX_STRING_LENGTH))
+        for _ in range(FUZZ_ITERATIONS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def unicode_corpus():
+    # Smaller for unicode
+    return [
+        random_unicode_string(random.randint(0, 1000)) for _ in range(FUZZ_ITERATIONS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def email_corpus():
+    return [random_malformed_email() for _ in range(FUZZ_ITERATIONS)]
+
+
+@pytest.fixture(scope="module")
+def mime_corpus():
+    return [
+        "\r\n".join(random_mime_header() for _ in range(random.randint(1, 10)))
+        + "\r\n\r\n"
+        + random_string(100)
+        for _ in range(FUZZ_ITERATIONS)
+    ]
+
+
 class TestFuzzSanitization:
     """Fuzz tests for text sanitization."""
 
-    @pytest.fixture
-    def privacy_guard(self):
-        """Create a privacy guard instance."""
-        return PrivacyGuard()
-
-    def test_fuzz_random_ascii_strings(self, privacy_guard):
+    def test_fuzz_random_ascii_strings(self, privacy_guard, ascii_corpus):
         """Sanitization should handle random ASCII strings."""
-        for _ in range(FUZZ_ITERATIONS):
-            length = random.randint(0, MAX_STRING_LENGTH)
-            text = random_string(length)
-
+        for text in ascii_corpus:
             try:
                 result = privacy_guard.sanitize(text)
                 assert result is not None or result == ""
             except Exception as e:
                 pytest.fail(f"Crash on random ASCII string: {e}")
 
-    def test_fuzz_random_unicode_strings(self, privacy_guard):
+    def test_fuzz_random_unicode_strings(self, privacy_guard, unicode_corpus):
         """Sanitization should handle random unicode strings."""
-        for _ in range(FUZZ_ITERATIONS):
-            length = random.randint(0, 1000)  # Smaller for unicode
-            text = random_unicode_string(length)
-
+        for text in unicode_corpus:
             try:
                 _ = privacy_guard.sanitize(text)
                 # May return empty or modified, but shouldn't crash
@@ -100,21 +138,9 @@ class TestFuzzSanitization:
             except Exception as e:
                 pytest.fail(f"Unexpected crash on unicode: {e}")
 
-    def test_fuzz_email_addresses(self, privacy_guard):
+    def test_fuzz_email_addresses(self, privacy_guard, email_corpus):
         """Sanitization should handle malformed email addresses."""
-        for _ in range(FUZZ_ITERATIONS):
-            # Various malformed email patterns
-            patterns = [
-                random_email_address(),
-                f"@{random_string(10)}.com",
-                f"{random_string(10)}@",
-                f"{random_string(10)}@@{random_string(5)}.com",
-                "a" * 1000 + "@test.com",
-                "test@" + "a" * 1000,
-                f"{random_string(10)}@{random_string(10)}@{random_string(10)}",
-            ]
-            text = random.choice(patterns)
-
+        for text in email_corpus:
             try:
                 _ = privacy_guard.sanitize(text)
                 # Should complete without hanging
@@ -160,16 +186,9 @@ class TestFuzzJSONHandling:
 class TestFuzzMIMEContent:
     """Fuzz tests for MIME-like content."""
 
-    @pytest.fixture
-    def privacy_guard(self):
-        return PrivacyGuard()
-
-    def test_fuzz_mime_headers(self, privacy_guard):
+    def test_fuzz_mime_headers(self, privacy_guard, mime_corpus):
         """MIME-like headers in content should be handled."""
-        for _ in range(FUZZ_ITERATIONS):
-            headers = [random_mime_header() for _ in range(random.randint(1, 10))]
-            content = "\r\n".join(headers) + "\r\n\r\n" + random_string(100)
-
+        for content in mime_corpus:
             try:
                 _ = privacy_guard.sanitize(content)
                 # Should not crash
@@ -222,10 +241,6 @@ Content-Transfer-Encoding: base64
 class TestFuzzControlCharacters:
     """Fuzz tests for control characters."""
 
-    @pytest.fixture
-    def privacy_guard(self):
-        return PrivacyGuard()
-
     def test_fuzz_null_bytes(self, privacy_guard):
         """Null bytes should not crash the system."""
         for _ in range(50):
@@ -322,10 +337,6 @@ class TestFuzzPromptInjection:
 class TestFuzzReDoS:
     """Fuzz tests for ReDoS (Regular Expression Denial of Service)."""
 
-    @pytest.fixture
-    def privacy_guard(self):
-        return PrivacyGuard()
-
     def test_fuzz_redos_email_pattern(self, privacy_guard):
         """Email regex should not be vulnerable to ReDoS."""
         import time
@@ -370,10 +381,6 @@ class TestFuzzReDoS:
 class TestFuzzEdgeCases:
     """Fuzz tests for various edge cases."""
 
-    @pytest.fixture
-    def privacy_guard(self):
-        return PrivacyGuard()
-
     def test_fuzz_extreme_lengths(self, privacy_guard):
         """Extreme string lengths should be handled."""
         lengths = [0, 1, 10, 100, 1000, 10000, 50000]
@@ -0,0 +1,28 @@
+"""
+Unit tests for backend logger setup.
+"""
+
+import logging
+import sys
+
+from backend.utils.logger import logger, setup_logger
+
+
+class TestSetupLogger:
+    """Tests for setup_logger."""
+
+    def test_repeat_setup_reuses_logger(self):
+        """A second setup for the same name should not add handlers."""
+        handlers = list(logger.handlers)
+
+        assert setup_logger("MailSorter") is logger
+        assert logger.handlers == handlers
+
+    def test_never_writes_to_stdout(self):
+        """No handler may target stdout (Native Messaging channel)."""
+        streams = [
+            h.stream for h in logger.handlers if isinstance(h, logging.StreamHandler)
+        ]
+
+        assert sys.stdout not in streams
+        assert sys.stderr in streams
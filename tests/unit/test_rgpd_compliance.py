@@ -8,7 +8,6 @@ Task: V5-026
 """
 
 import pytest
-import json
 from pathlib import Path
 
 from backend.core.privacy import PrivacyGuard
@@ -156,15 +155,6 @@ class TestNoDataPersistence:
 class TestExtensionPermissions:
     """Tests verifying extension permissions are minimal."""
 
-    @pytest.fixture
-    def manifest(self):
-        """Load extension manifest."""
-        manifest_path = (
-            Path(__file__).parent.parent.parent / "extension" / "manifest.json"
-        )
-        with open(manifest_path) as f:
-            return json.load(f)
-
     def test_no_all_urls_permission(self, manifest):
         """Extension should not request <all_urls>."""
         permissions = manifest.get("permissions", [])
@@ -187,6 +187,24 @@ class TestSmartCache:
         assert result["folder"] == "Cached"
         assert result["source"] == "hash_cache"
 
+    # === Bulk Store ===
+
+    def test_store_many(self):
+        """Should store a batch and skip low-confidence results."""
+        stored = self.cache.store_many(
+            [
+                ("Subject A", "Body A", "a@test.com", "Work", 0.9),
+                ("Subject B", "Body B", "b@test.com", "Personal", 0.5),
+            ]
+        )
+
+        assert stored == 1
+        assert self.cache.get_stats()["stores"] == 1
+        result = self.cache.check("Other", "Other", "a@test.com", ["Work"])
+        assert result is not None
+        assert result.folder == "Work"
+        assert self.cache.check("Other", "Other", "b@test.com", ["Personal"]) is None
+
     # === Statistics ===
 
     def test_stats(self):